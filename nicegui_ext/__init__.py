@@ -1 +1,2 @@
 from nicegui_ext.draggable import Column, Draggable, Row
+from nicegui_ext.helpers import batch_updates
@@ -1,2 +1,5 @@
 from nicegui_ext.auto.class_element import ClassElement
+from nicegui_ext.auto.list_element import ClassListElement
 from nicegui_ext.auto.pydantic_element import PydanticModelElement
+from nicegui_ext.auto.parser import compile_coercer
+from nicegui_ext.auto.registry import ELEMENT_REGISTRY
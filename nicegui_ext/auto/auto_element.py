@@ -1,12 +1,14 @@
 import re
 import sys
+import typing as T
 
 from nicegui import ui
 from nicegui.element import Element
 
 from nicegui_ext import icons, md
-from nicegui_ext.auto.parser import DEFAULT_VALUES
+from nicegui_ext.auto.registry import ELEMENT_REGISTRY
 from nicegui_ext.draggable import Draggable
+from nicegui_ext.helpers import batch_updates
 from nicegui_ext.ui import tooltip
 
 SINGLE_ROW = [sys.maxsize]  # all elements in one row
@@ -26,6 +28,8 @@ class AutoElement(Draggable):
         expandable: bool = False,
         add_menu: bool = True,
         width_class: str = "w-fit-content",
+        client_side_drag: bool = False,
+        lazy: bool = False,
     ) -> None:
         self._title_text = title
         self._icon_name = icon
@@ -36,10 +40,18 @@ class AutoElement(Draggable):
         self._elements_per_row: list[int] = elements_per_row.copy()
         self._row_index = 0
         self.is_expandable = expandable
+        self.is_lazy = lazy and expandable
+        self.is_built = not self.is_lazy
         self.rows: list[ui.row] = []
         self.field_elements: dict[str, Element] = {}
-
-        super().__init__(enable_dragging=draggable, width_class=width_class)
+        self.pending_values: dict[str, T.Any] = {}  # values of fields that are not built yet
+        self.dirty_fields: set[str] = set()  # changed since their value was last parsed
+        self.changed_fields: set[str] = set()  # changed since the last snapshot
+        self.untracked_fields: set[str] = set()  # elements without change events
+
+        super().__init__(
+            enable_dragging=draggable, width_class=width_class, client_side=client_side_drag
+        )
         self._build_extras()
 
     def get_description(self, description: str | None) -> str | None:
@@ -101,8 +113,10 @@ class AutoElement(Draggable):
             self.container = ui.expansion(
                 self._title_text,
                 icon=self._icon_name,
-                value=True,
+                value=not self.is_lazy,
             ).classes(self.width_class)
+            if self.is_lazy:
+                self.container.on_value_change(self._on_expand)
 
             if self._description_text:
                 with self.container:
@@ -134,11 +148,67 @@ class AutoElement(Draggable):
             for element in extras:
                 element.move(self.get_current_row())
 
-    def clear_fields(self):
+    def _on_expand(self, e) -> None:
+        if e.value:
+            self.ensure_built()
+
+    def ensure_built(self) -> None:
+        """Build the fields of a lazy section if they were not built yet."""
+        if self.is_built:
+            return
+        self.is_built = True
+        with batch_updates(self):
+            self.build_fields()
+
+    def get_field_element_type(self, name: str) -> T.Type[Element] | None:
+        """Get the input element class of a field that is not built yet."""
+        return None
+
+    def register_field(self, name: str, element: Element) -> None:
+        """Add the input element of a field and track its changes."""
+        self.field_elements[name] = element
+        if hasattr(element, "on_value_change"):
+            element.on_value_change(lambda _: self.mark_dirty(name))
+        else:
+            self.untracked_fields.add(name)
+
+    def mark_dirty(self, name: str) -> None:
+        self.dirty_fields.add(name)
+        self.changed_fields.add(name)
+
+    def is_dirty(self, name: str) -> bool:
+        return name in self.dirty_fields or name in self.untracked_fields
+
+    def set_pending_value(self, name: str, value: T.Any) -> None:
+        self.pending_values[name] = value
+        self.mark_dirty(name)
+
+    def get_field_value(self, name: str) -> T.Any:
+        if name in self.pending_values:
+            return self.pending_values[name]
+        return self.field_elements[name].value  # type: ignore
+
+    def get_field_values(self) -> dict[str, T.Any]:
+        """Get the values of all fields. Unbuilt fields return their stored values."""
+        values = dict(self.pending_values)
         for k, v in self.field_elements.items():
-            default_val = DEFAULT_VALUES.get(type(v), None)  # type: ignore
+            values[k] = v.value  # type: ignore
+        return values
+
+    def clear_fields(self):
+        for k in self.pending_values:
+            default_val = ELEMENT_REGISTRY.default_value(self.get_field_element_type(k))
             if default_val is not None:
-                v.value = default_val  # type: ignore
+                self.set_pending_value(k, default_val)
+
+        with batch_updates(self):
+            for k, v in self.field_elements.items():
+                default_val = ELEMENT_REGISTRY.default_value(type(v))
+                if default_val is not None:
+                    v.value = default_val  # type: ignore
+
+    def build_fields(self):
+        raise NotImplementedError
 
     def build(self):
         raise NotImplementedError
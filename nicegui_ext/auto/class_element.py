@@ -1,16 +1,71 @@
+import asyncio
+import copy
+import inspect
 import typing as T
+from concurrent.futures import Executor
+from functools import cached_property, partial
 
 from nicegui import ui
 from nicegui.element import Element
 from objinspect import Class, Parameter
-from objinspect.util import get_literal_choices, is_literal
 
 from nicegui_ext.auto.auto_element import SINGLE_ROW, AutoElement
-from nicegui_ext.auto.parser import DEFAULT_VALUES, STR_PARSER, element_for_type
-from nicegui_ext.helpers import element_init_takes_label, err_message_missing_param, is_type
+from nicegui_ext.auto.parser import compile_coercer, to_input_value
+from nicegui_ext.auto.plan import (
+    FormPlan,
+    compile_class_plan,
+    compile_field,
+    get_default,
+    get_form_plan,
+)
+from nicegui_ext.auto.registry import ELEMENT_REGISTRY
+from nicegui_ext.auto.state import StateFormat, decode_state, encode_state, is_state
+from nicegui_ext.helpers import batch_updates, err_message_missing_param
 from nicegui_ext.ui import notification, tooltip
 
 
+class FieldValidationError(ValueError):
+    """Raised when the values of one or more fields are invalid. Maps field names to error messages."""
+
+    def __init__(self, errors: dict[str, str]) -> None:
+        self.errors = errors
+        super().__init__("; ".join(f"{k}: {v}" if k else v for k, v in errors.items()))
+
+    def __reduce__(self):
+        return FieldValidationError, (self.errors,)
+
+
+def build_instance(cls: T.Type, types: dict[str, T.Any], values: dict[str, T.Any]) -> T.Any:
+    """
+    Coerce raw field values and construct an instance of a class.
+    Runs in executors, so the arguments and the result must be picklable for process pools.
+
+    Raises:
+        FieldValidationError: If values can't be coerced, or the constructor raised a pydantic-style validation error.
+    """
+    args = {}
+    errors = {}
+    for k, v in values.items():
+        try:
+            args[k] = compile_coercer(types[k])(v)
+        except Exception as e:
+            errors[k] = str(e)
+    if errors:
+        raise FieldValidationError(errors)
+
+    try:
+        return cls(**args)
+    except Exception as e:
+        get_errors = getattr(e, "errors", None)
+        if not callable(get_errors):
+            raise
+        try:
+            errors = {str(i["loc"][0]) if i.get("loc") else "": i["msg"] for i in get_errors()}
+        except Exception:
+            raise e
+        raise FieldValidationError(errors) from None
+
+
 class ClassElement(AutoElement):
     def __init__(
         self,
@@ -25,9 +80,15 @@ class ClassElement(AutoElement):
         expandable: bool = False,
         extras: list[Element] | None = None,
         width_class: str = "w-fit-content",
+        client_side_drag: bool = False,
+        lazy: bool = False,
     ) -> None:
         self.cls = cls
-        self.obj = Class(self.cls)
+        self.is_instance = not inspect.isclass(cls)
+        self.plan = self.get_form_plan()
+        self.parsed_values: dict[str, T.Any] = {}
+        self._snapshot: dict[str, T.Any] | None = None
+        self.is_submitting = False
         self._title_value = title
         self.ignored_fields = ignored_fields or []
         self.n_params = self.get_n_params()
@@ -36,35 +97,88 @@ class ClassElement(AutoElement):
         super().__init__(
             elements_per_row=elements_per_row,
             title=self.get_title(),
-            description=self.obj.description or None if description else None,
+            description=self.plan.description or None if description else None,
             icon=icon,
             icon_size=icon_size,
             draggable=draggable,
             width_class=width_class,
             expandable=expandable,
+            client_side_drag=client_side_drag,
+            lazy=lazy,
         )
         self._fill_elements_per_row()
         with self.menu:
             ui.menu_item("Reset to defaults", on_click=self.reset_to_defaults)
 
+    @cached_property
+    def obj(self) -> Class:
+        return Class(self.cls)
+
+    def get_form_plan(self) -> FormPlan:
+        """Get the cached form plan for the class. Override to change how the class is inspected."""
+        cls = self.cls.__class__ if self.is_instance else self.cls
+        return get_form_plan(cls, compile_class_plan)
+
     def get_title(self) -> str | None:
         if isinstance(self._title_value, str):
             return self.format_title(self._title_value)
         if isinstance(self._title_value, bool):
             if self._title_value:
-                return self.format_title(self.obj.name)
+                return self.format_title(self.plan.name)
             return None
         raise TypeError(f"Invalid type for title: {type(self._title_value)}")
 
     def get_instance(self) -> T.Any:
-        if self.obj.is_initialized:
+        if self.is_instance:
             return self.cls.__class__(**self.get_args())
         return self.cls(**self.get_args())
 
+    async def get_instance_async(self, executor: Executor | None = None) -> T.Any:
+        """
+        Like `get_instance`, but coerces the values and constructs the instance in an executor,
+        so slow constructors don't block the event loop.
+
+        Invalid fields are reported with a notification each.
+        While a call is in progress, further calls show a warning and return None.
+
+        Args:
+            executor (Executor, optional): Thread or process pool to use. Defaults to the default executor of the event loop.
+        """
+        if self.is_submitting:
+            notification("Submission already in progress", type="warning")
+            return None
+
+        self.is_submitting = True
+        try:
+            values = {}
+            missing_args = {}
+            for k, value in self.get_field_values().items():
+                param = self.plan.fields[k].param
+                if value is None and param.is_required:
+                    missing_args[k] = err_message_missing_param(param)
+                else:
+                    values[k] = value
+            if missing_args:
+                self._raise_missing(missing_args)
+
+            cls = self.cls.__class__ if self.is_instance else self.cls
+            types = {k: self.plan.fields[k].param.type for k in values}
+            loop = asyncio.get_running_loop()
+            try:
+                return await loop.run_in_executor(
+                    executor, partial(build_instance, cls, types, values)
+                )
+            except FieldValidationError as e:
+                for k, message in e.errors.items():
+                    notification(
+                        f"{self.format_label(k)}: {message}" if k else message, type="warning"
+                    )
+                raise
+        finally:
+            self.is_submitting = False
+
     def get_init_params(self) -> dict[str, Parameter]:
-        if not self.obj.init_method:
-            return {}
-        return self.obj.init_method._parameters
+        return self.plan.params
 
     def get_n_params(self) -> int:
         params = self.get_init_params()
@@ -73,59 +187,161 @@ class ClassElement(AutoElement):
         return sum(1 for i in params.keys() if i not in self.ignored_fields)
 
     def get_args(self) -> dict[str, T.Any]:
-        init_params = self.get_init_params()
+        return self._get_args([*self.pending_values, *self.field_elements])
+
+    def _get_args(self, names: T.Iterable[str]) -> dict[str, T.Any]:
+        fields = self.plan.fields
         args = {}
         missing_args = {}
-        for k, v in self.field_elements.items():
-            value = v.value  # type: ignore
-            param = init_params[k]
-
-            if value is None and param.is_required:
-                missing_args[k] = err_message_missing_param(param)
+        for k in names:
+            if k in self.parsed_values and not self.is_dirty(k):
+                args[k] = self.parsed_values[k]
                 continue
 
-            if not param.is_typed:
-                args[k] = value
+            value = self.get_field_value(k)
+            field = fields[k]
+
+            if value is None and field.param.is_required:
+                missing_args[k] = err_message_missing_param(field.param)
                 continue
 
-            type_hint = init_params[k].type
-            if is_type(value, type_hint):
-                args[k] = value
-            else:
-                args[k] = STR_PARSER.parse(value, type_hint)
+            args[k] = self.parsed_values[k] = field.coerce(value)
+            self.dirty_fields.discard(k)
 
         if missing_args:
-            for i in missing_args.values():
-                notification(i, type="warning")
-            missing_names = ", ".join(f"'{i}'" for i in missing_args.keys())
-            raise ValueError(f"Missing required arguments: {missing_names}")
-        return args
+            self._raise_missing(missing_args)
+        # Cached values are reused, so don't share mutable containers between calls
+        return {k: copy.copy(v) if isinstance(v, (list, dict, set)) else v for k, v in args.items()}
+
+    def get_field_state(self, name: str) -> T.Any:
+        element = self.field_elements.get(name)
+        if element is not None and hasattr(element, "get_state"):
+            return element.get_state()  # type: ignore
+        return to_input_value(self.get_field_value(name))
+
+    def set_field_state(self, name: str, value: T.Any) -> None:
+        element = self.field_elements.get(name)
+        if element is None:
+            self.set_pending_value(name, value)
+        elif hasattr(element, "set_state"):
+            element.set_state(value)  # type: ignore
+        else:
+            element.value = value  # type: ignore
+
+    def get_state(self) -> dict[str, T.Any]:
+        """
+        Get the raw values of all fields, keyed by the schema hash of the class.
+        Nested forms and editors store their own state.
+        """
+        names = [*self.pending_values, *self.field_elements]
+        return {
+            "schema": self.plan.schema_hash,
+            "values": {k: self.get_field_state(k) for k in names},
+        }
+
+    def set_state(self, state: dict[str, T.Any], check_schema: bool = True) -> None:
+        """
+        Restore the values of a state returned by `get_state`. Values of unknown fields are ignored.
+        Sections that were expanded when the state was saved are built. The browser is updated once.
+
+        Raises:
+            ValueError: If the state was saved for a different version of the class.
+        """
+        if check_schema and state.get("schema") != self.plan.schema_hash:
+            raise ValueError(f"Form state does not match the schema of '{self.plan.name}'")
+        values = state["values"]
+        with batch_updates(self):
+            if any(is_state(i) for i in values.values()):
+                self.ensure_built()
+            for k, v in values.items():
+                if k in self.pending_values or k in self.field_elements:
+                    self.set_field_state(k, v)
+
+    def dump_state(self, format: StateFormat = "json") -> bytes:
+        """Serialize the state of the form. See `get_state`."""
+        return encode_state(self.get_state(), format)
+
+    def load_state(self, data: bytes | str, format: StateFormat = "json") -> None:
+        """Restore a state serialized with `dump_state`."""
+        self.set_state(decode_state(data, format))
+
+    def _raise_missing(self, missing_args: dict[str, str]) -> T.NoReturn:
+        for i in missing_args.values():
+            notification(i, type="warning")
+        missing_names = ", ".join(f"'{i}'" for i in missing_args.keys())
+        raise ValueError(f"Missing required arguments: {missing_names}")
+
+    def take_snapshot(self) -> dict[str, T.Any]:
+        """Record the current arguments as the baseline for `get_changed_args`."""
+        self._snapshot = self.get_args()
+        self.changed_fields.clear()
+        return self._snapshot.copy()
+
+    def get_changed_args(self) -> dict[str, T.Any]:
+        """
+        Get the arguments that changed since the last snapshot.
+        Only fields that were edited since the snapshot are parsed.
+        Returns all arguments if no snapshot was taken.
+        """
+        if self._snapshot is None:
+            return self.get_args()
+        if not self.changed_fields and not self.untracked_fields:
+            return {}
+        args = self._get_args(self.changed_fields | self.untracked_fields)
+        return {k: v for k, v in args.items() if k not in self._snapshot or self._snapshot[k] != v}
 
     def format_title(self, title: str) -> str:
         title = super().format_title(title)
-        if title.endswith(" instance") and self.obj.is_initialized:
+        if title.endswith(" instance") and self.is_instance:
             title = title[: -len(" instance")]
         return title
 
+    def get_initial_value(self, param: Parameter) -> T.Any:
+        if self.is_instance:
+            return getattr(self.cls, param.name)
+        if not param.is_required:
+            return get_default(param)
+        return None
+
+    def get_field_element_type(self, name: str) -> T.Type[Element] | None:
+        field = self.plan.fields.get(name)
+        return field.element if field else None
+
+    def to_element_value(self, name: str, value: T.Any) -> T.Any:
+        """Convert a value of a field to the value of its input element."""
+        return to_input_value(value)
+
     def add_input_element_for_param(self, param: Parameter) -> None:
-        elem = element_for_type(param.type)
+        field = self.plan.fields.get(param.name) or compile_field(param)
+        elem = field.element
+        if elem is None:
+            raise ValueError(f"No input element for type {param.type}")
+
         kwargs = {}
-        if element_init_takes_label(elem):
+        if field.takes_label:
             kwargs["label"] = self.format_label(param.name)
+        if field.takes_lazy:
+            kwargs["lazy"] = True
 
+        if param.name in self.pending_values:
+            value = self.pending_values.pop(param.name)
+            if value is not None or not param.is_required:
+                kwargs["value"] = value
         # Experimental
-        if self.obj.is_initialized:
-            kwargs["value"] = getattr(self.obj.instance, param.name)
+        elif self.is_instance:
+            kwargs["value"] = getattr(self.cls, param.name)
         elif not param.is_required:
-            kwargs["value"] = param.default
+            kwargs["value"] = get_default(param)
+
+        if "value" in kwargs:
+            kwargs["value"] = self.to_element_value(param.name, kwargs["value"])
 
         if param.type is bool:
             kwargs["text"] = self.format_label(param.name)
 
-        type_literal = is_literal(param.type)
+        type_literal = field.choices is not None
         if type_literal:
-            opts = list(get_literal_choices(param.type))
-            kwargs["options"] = opts
+            kwargs["options"] = field.choices.copy()  # type: ignore
             if "label" in kwargs:
                 del kwargs["label"]
 
@@ -140,7 +356,7 @@ class ClassElement(AutoElement):
             with e:
                 tooltip(param.description)
 
-        self.field_elements[param.name] = e
+        self.register_field(param.name, e)
 
     def _fill_elements_per_row(self) -> None:
         """
@@ -156,27 +372,45 @@ class ClassElement(AutoElement):
         if not init_params:
             return
 
-        for element_field_name, element in self.field_elements.items():
-            param = init_params[element_field_name]
+        for name in self.pending_values:
+            param = init_params[name]
             if not param.is_required:
-                element.value = param.default  # type:ignore
+                self.set_pending_value(name, get_default(param))
             else:
-                default_val = DEFAULT_VALUES.get(type(element), None)  # type:ignore
+                default_val = ELEMENT_REGISTRY.default_value(self.get_field_element_type(name))
                 if default_val is not None:
-                    element.value = default_val  # type:ignore
+                    self.set_pending_value(name, default_val)
+
+        with batch_updates(self):
+            for element_field_name, element in self.field_elements.items():
+                param = init_params[element_field_name]
+                if not param.is_required:
+                    element.value = self.to_element_value(element_field_name, get_default(param))  # type: ignore
+                else:
+                    default_val = ELEMENT_REGISTRY.default_value(type(element))
+                    if default_val is not None:
+                        element.value = default_val  # type:ignore
 
     def build(self) -> None:
-        init_method = self.obj.init_method
-        if not init_method:
+        if not self.plan.has_init:
             return
 
         self.build_title_row()
+        if self.is_built:
+            self.build_fields()
+            return
+
+        # Lazy: fields are built when the expansion is first opened
+        for param in self.plan.params.values():
+            if param.name not in self.ignored_fields:
+                self.pending_values[param.name] = self.get_initial_value(param)
 
-        for param in init_method.params:
+    def build_fields(self) -> None:
+        for param in self.plan.params.values():
             if param.name in self.ignored_fields:
                 continue
             with self.get_current_row():
                 self.add_input_element_for_param(param)
 
 
-__all__ = ["ClassElement"]
+__all__ = ["ClassElement", "FieldValidationError", "build_instance"]
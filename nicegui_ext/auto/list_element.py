@@ -0,0 +1,225 @@
+import typing as T
+
+from nicegui import ui
+from nicegui.element import Element
+from objinspect import Parameter
+
+from nicegui_ext import icons
+from nicegui_ext.auto.parser import to_input_value
+from nicegui_ext.auto.plan import (
+    FieldPlan,
+    FormPlan,
+    compile_class_plan,
+    get_default,
+    get_form_plan,
+)
+from nicegui_ext.helpers import clean_variable_name, err_message_missing_param
+from nicegui_ext.ui import VirtualColumn, notification
+
+
+class _Row:
+    """Values of a single object and the cell editors that are open for it. Editors write their values through."""
+
+    def __init__(self, values: dict[str, T.Any]) -> None:
+        self.values = values
+        self.editors: dict[str, Element] = {}
+
+    def get_value(self, name: str) -> T.Any:
+        return self.values[name]
+
+
+class ClassListElement(ui.column):
+    """
+    Editor for a list of objects of the same class.
+
+    The class is reflected once and every object is rendered as a row of plain labels.
+    An input element is only created for a cell when it is clicked.
+    Only the rows of the pages in or near the viewport are built. See `VirtualColumn`.
+
+    Args:
+        cls (type): The class of the objects.
+        items (list, optional): Initial objects. Their attributes are used as values.
+        ignored_fields (list[str], optional): Names of parameters that are not shown.
+        page_size (int, optional): Number of rows in a page.
+        height_class (str, optional): Height of the scrollable area.
+        cell_width_class (str, optional): Width of a single cell.
+        item_height (int, optional): Minimal height of a row in pixels.
+        window (int, optional): Number of pages built on each side of the page in view.
+        lazy (bool, optional): Don't build the first pages until `ensure_rendered()` is called.
+
+    Fields without an input element are not shown. Their values are taken from the objects and passed through as they are.
+    """
+
+    def __init__(
+        self,
+        cls: T.Type,
+        items: T.Iterable[T.Any] | None = None,
+        ignored_fields: list[str] | None = None,
+        page_size: int = 50,
+        height_class: str = "h-[70vh]",
+        cell_width_class: str = "w-40",
+        item_height: int = 40,
+        window: int = 1,
+        lazy: bool = False,
+    ) -> None:
+        super().__init__()
+        self.cls = cls
+        self.plan = self.get_form_plan()
+        self.ignored_fields = ignored_fields or []
+        self.fields: dict[str, FieldPlan] = {
+            k: v for k, v in self.plan.fields.items() if k not in self.ignored_fields
+        }
+        self.columns: dict[str, FieldPlan] = {
+            k: v for k, v in self.fields.items() if v.element is not None
+        }
+
+        self.cell_width_class = cell_width_class
+        self.rows: list[_Row] = [self._row_from_instance(i) for i in items or []]
+
+        with self:
+            with ui.row().classes("items-center no-wrap font-semibold"):
+                for name in self.columns:
+                    ui.label(self.format_label(name)).classes(self.cell_width_class)
+            self.rows_view = (
+                VirtualColumn(
+                    self._render_row,
+                    items=self.rows,
+                    page_size=page_size,
+                    item_height=item_height,
+                    window=window,
+                    lazy=lazy,
+                )
+                .classes(height_class)
+                .classes("w-full")
+            )
+            with ui.row():
+                ui.button(icon=icons.ADD, on_click=lambda: self.add_row())
+
+    def get_form_plan(self) -> FormPlan:
+        """Get the cached form plan for the class. Override to change how the class is inspected."""
+        return get_form_plan(self.cls, compile_class_plan)
+
+    def format_label(self, label: str) -> str:
+        return clean_variable_name(label)
+
+    def format_value(self, value: T.Any) -> str:
+        return "" if value is None else str(value)
+
+    def get_initial_value(self, param: Parameter, obj: T.Any = None) -> T.Any:
+        if obj is not None:
+            return getattr(obj, param.name)
+        if not param.is_required:
+            return get_default(param)
+        return None
+
+    def _row_from_instance(self, obj: T.Any = None) -> _Row:
+        return _Row({k: self.get_initial_value(v.param, obj) for k, v in self.fields.items()})
+
+    def __len__(self) -> int:
+        return len(self.rows)
+
+    @property
+    def value(self) -> list[T.Any]:
+        return self.get_instances()
+
+    @value.setter
+    def value(self, items: T.Iterable[T.Any] | None) -> None:
+        self.set_items(items)
+
+    def set_items(self, items: T.Iterable[T.Any] | None) -> None:
+        """Replace all rows with rows for the given objects."""
+        self._set_rows([self._row_from_instance(i) for i in items or []])
+
+    def _set_rows(self, rows: list[_Row]) -> None:
+        self.rows = self.rows_view.items = rows
+        self.rows_view.current_page = 0
+        self.rows_view.refresh()
+
+    def get_state(self) -> dict[str, T.Any]:
+        """Get the raw values of the editable fields of every row, keyed by the schema hash of the class."""
+        return {
+            "schema": self.plan.schema_hash,
+            "rows": [{k: to_input_value(i.get_value(k)) for k in self.columns} for i in self.rows],
+        }
+
+    def set_state(self, state: dict[str, T.Any], check_schema: bool = True) -> None:
+        """Replace all rows with the rows of a state returned by `get_state`. Hidden fields get their defaults."""
+        if check_schema and state.get("schema") != self.plan.schema_hash:
+            raise ValueError(f"List state does not match the schema of '{self.plan.name}'")
+        rows = []
+        for values in state["rows"]:
+            row = self._row_from_instance()
+            row.values.update((k, v) for k, v in values.items() if k in self.columns)
+            rows.append(row)
+        self._set_rows(rows)
+
+    def ensure_rendered(self) -> None:
+        """Build the first pages if nothing was built yet."""
+        self.rows_view.ensure_rendered()
+
+    def _render_row(self, row: _Row) -> None:
+        row.editors.clear()  # editors of a deleted page
+        for name, field in self.columns.items():
+            with ui.element("div").classes(self.cell_width_class) as cell:
+                ui.label(self.format_value(row.values[name])).classes(
+                    "cursor-pointer min-h-[1.5rem]"
+                )
+            cell.on("click", lambda cell=cell, field=field: self._open_editor(cell, row, field))
+        ui.button(icon=icons.CLOSE, on_click=lambda: self.remove_row(row)).props("flat round dense")
+
+    def _open_editor(self, cell: Element, row: _Row, field: FieldPlan) -> None:
+        if field.name in row.editors:
+            return
+        kwargs = {}
+        value = row.values[field.name]
+        if value is not None or not field.param.is_required:
+            kwargs["value"] = to_input_value(value)
+        if field.choices is not None:
+            kwargs["options"] = field.choices.copy()
+        if field.takes_lazy:
+            kwargs["lazy"] = True
+
+        cell.clear()
+        with cell:
+            editor = field.element(**kwargs).props("dense")  # type: ignore
+        editor.on_value_change(lambda e: row.values.__setitem__(field.name, e.value))
+        row.editors[field.name] = editor
+
+    def add_row(self, obj: T.Any = None) -> None:
+        """Add a row for an object. Adds a row with default values if no object is given."""
+        self.rows.append(self._row_from_instance(obj))
+        if self.rows_view.pages:
+            self.rows_view.refresh(len(self.rows) - 1)
+
+    def remove_row(self, row: _Row) -> None:
+        index = next(i for i, r in enumerate(self.rows) if r is row)
+        del self.rows[index]
+        if self.rows_view.pages:
+            self.rows_view.refresh(index)
+
+    def get_args_list(self) -> list[dict[str, T.Any]]:
+        """Get the coerced constructor arguments of every row."""
+        args_list = []
+        missing_args = {}
+        for index, row in enumerate(self.rows):
+            args = {}
+            for name, field in self.fields.items():
+                value = row.get_value(name)
+                if value is None and field.param.is_required:
+                    missing_args[(index, name)] = err_message_missing_param(field.param)
+                    continue
+                args[name] = field.coerce(value)
+            args_list.append(args)
+
+        if missing_args:
+            for i in set(missing_args.values()):
+                notification(i, type="warning")
+            missing_rows = ", ".join(str(i + 1) for i in sorted({i for i, _ in missing_args}))
+            raise ValueError(f"Missing required arguments in rows: {missing_rows}")
+        return args_list
+
+    def get_instances(self) -> list[T.Any]:
+        return [self.cls(**args) for args in self.get_args_list()]
+
+
+__all__ = ["ClassListElement"]
@@ -1,45 +1,159 @@
 import datetime
+import json
 import typing as T
 from functools import lru_cache
 
-from nicegui import ui
 from nicegui.element import Element
-from objinspect.util import is_literal
+from objinspect.constants import EMPTY
 from strto import get_parser
+from strto.constants import ITER_SEP
 
-from nicegui_ext.ui import DatePicker
+from nicegui_ext.auto.registry import (  # noqa: F401 - DEFAULT_VALUES and INPUT_ELEMENTS are re-exported
+    DEFAULT_VALUES,
+    ELEMENT_REGISTRY,
+    INPUT_ELEMENTS,
+)
+from nicegui_ext.helpers import UNION_TYPES, compile_validator
 
-INPUT_ELEMENTS = {
-    int: ui.number,
-    str: ui.input,
-    float: ui.number,
-    bool: ui.checkbox,
-    list: ui.textarea,
-    tuple: ui.textarea,
-    datetime.date: DatePicker,
-    T.Literal: ui.select,
-}
+STR_PARSER = get_parser()
 
-DEFAULT_VALUES = {
-    ui.number: 0,
-    ui.input: "",
-    ui.checkbox: False,
-    ui.textarea: "",
-    DatePicker: None,
-}
 
+def element_for_type(t: T.Type) -> Element:
+    return ELEMENT_REGISTRY.element_for_type(t)  # type: ignore
 
-STR_PARSER = get_parser()
 
+def to_input_value(value: T.Any) -> T.Any:
+    """Convert a value to what its input element shows. Containers are edited as text."""
+    if isinstance(value, datetime.date) and not isinstance(value, datetime.datetime):
+        return value.isoformat()
+    if isinstance(value, dict):
+        return json.dumps(value, default=str)
+    if isinstance(value, (list, tuple, set, frozenset)):
+        return ITER_SEP.join(map(str, value))
+    return value
 
-@lru_cache(maxsize=256)
-def element_for_type(t: T.Type) -> Element:
-    if t in INPUT_ELEMENTS:
-        return INPUT_ELEMENTS[t]
-    if args := T.get_args(t):
-        for i in args:
-            if i in INPUT_ELEMENTS:
-                return INPUT_ELEMENTS[i]
-    if is_literal(t):
-        return INPUT_ELEMENTS[T.Literal]
-    raise ValueError(f"No input element for type {t}")
+
+def _identity(value: T.Any) -> T.Any:
+    return value
+
+
+def _cast_to(t: T.Type) -> T.Callable[[T.Any], T.Any]:
+    def coerce(value: T.Any) -> T.Any:
+        if isinstance(value, t):
+            return value
+        if isinstance(value, str):
+            return t(value.strip())
+        return t(value)
+
+    return coerce
+
+
+def _coerce_date(value: T.Any) -> T.Any:
+    if isinstance(value, datetime.date):
+        return value
+    if isinstance(value, str):
+        try:
+            return datetime.date.fromisoformat(value.strip())
+        except ValueError:
+            pass
+    return STR_PARSER.parse(value, datetime.date)
+
+
+def _split_items(value: str) -> list[str]:
+    """Split the text of an iterable input. Blank text is an empty iterable."""
+    if not value.strip():
+        return []
+    return [i.strip() for i in value.split(ITER_SEP)]
+
+
+def _compile_coercer(t: T.Any) -> T.Callable[[T.Any], T.Any]:
+    if t is EMPTY or t is T.Any:
+        return _identity
+    if t in (int, float, str, bool):
+        return _cast_to(t)
+    if t is datetime.date:
+        return _coerce_date
+
+    origin = T.get_origin(t)
+    args = T.get_args(t)
+
+    if origin in UNION_TYPES:
+        checks = [compile_validator(i) for i in args]
+        coercers = [_compile_coercer(i) for i in args if i is not type(None)]
+
+        def coerce_union(value: T.Any) -> T.Any:
+            for check in checks:
+                if check(value):
+                    return value
+            for coerce in coercers:
+                try:
+                    return coerce(value)
+                except Exception:
+                    continue
+            raise ValueError(f"Could not parse {value} as {t}")
+
+        return coerce_union
+
+    check = compile_validator(t)
+    if origin is tuple and args and args[-1] is not Ellipsis:
+        item_coercers = [_compile_coercer(i) for i in args]
+
+        def coerce_tuple(value: T.Any) -> T.Any:
+            if check(value):
+                return value
+            if isinstance(value, str):
+                value = _split_items(value)
+            if isinstance(value, (list, tuple)):
+                if len(value) != len(item_coercers):
+                    raise ValueError(f"Expected {len(item_coercers)} items, got {len(value)}")
+                return tuple(coerce(i) for coerce, i in zip(item_coercers, value))
+            return STR_PARSER.parse(value, t)
+
+        return coerce_tuple
+
+    if origin in (list, tuple, set, frozenset) and args:
+        item_coerce = _compile_coercer(args[0])
+
+        def coerce_iterable(value: T.Any) -> T.Any:
+            if check(value):
+                return value
+            if isinstance(value, str):
+                return origin(item_coerce(i) for i in _split_items(value))  # type: ignore
+            if isinstance(value, (list, tuple, set, frozenset)):
+                return origin(item_coerce(i) for i in value)  # type: ignore
+            return STR_PARSER.parse(value, t)
+
+        return coerce_iterable
+
+    def coerce(value: T.Any) -> T.Any:
+        if check(value):
+            return value
+        return STR_PARSER.parse(value, t)
+
+    return coerce
+
+
+@lru_cache(maxsize=512)
+def _compile_coercer_cached(t: T.Any) -> T.Callable[[T.Any], T.Any]:
+    return _compile_coercer(t)
+
+
+def compile_coercer(t: T.Any) -> T.Callable[[T.Any], T.Any]:
+    """
+    Compile a type hint into a callable that converts input element values to that type.
+
+    Values that already have the hinted type are returned as they are.
+    int, float, str, bool, datetime.date, Literal, Optional/Union and parametrized list, tuple and set types
+    are handled by the returned callable directly, other types are parsed with `STR_PARSER`.
+    Blank text is an empty list, tuple or set. Fixed-length tuples coerce each item with its own type.
+
+    Args:
+        t (type): The type hint.
+
+    Returns:
+        A callable that takes a single value and returns it converted to the hinted type.
+    """
+    try:
+        return _compile_coercer_cached(t)
+    except TypeError:  # unhashable type hint
+        return _compile_coercer(t)
@@ -0,0 +1,207 @@
+import dataclasses
+import hashlib
+import json
+import typing as T
+from collections import OrderedDict
+from dataclasses import dataclass
+from functools import cached_property
+
+from nicegui.element import Element
+from objinspect import Class, Parameter
+from objinspect.util import get_literal_choices, is_literal
+
+from nicegui_ext.auto.parser import compile_coercer, element_for_type
+from nicegui_ext.auto.registry import ELEMENT_REGISTRY
+
+
+@dataclass(frozen=True)
+class DefaultFactory:
+    """
+    Default of a parameter that is created by a factory, like `Field(default_factory=...)` or `field(default_factory=...)`.
+    Plans are shared between forms, so the factory is called for each form instead of once per plan.
+    """
+
+    factory: T.Callable[[], T.Any]
+
+
+def get_default(param: Parameter) -> T.Any:
+    """Get the default value of an optional parameter. Default factories are called on every call."""
+    if isinstance(param.default, DefaultFactory):
+        return param.default.factory()
+    return param.default
+
+
+@dataclass(frozen=True)
+class FieldPlan:
+    """
+    Everything needed to build the input element for a single parameter.
+
+    Args:
+        param (Parameter): The parameter the field is built for.
+        element (type[Element] | None): The input element class. None if the type of the parameter has no input element.
+        takes_label (bool): Whether the element accepts a `label` argument.
+        choices (list | None): Choices for Literal types. None for other types.
+        coerce (Callable): Converts the value of the element to the type of the parameter.
+        takes_lazy (bool): Whether the element accepts a `lazy` argument.
+    """
+
+    param: Parameter
+    element: T.Type[Element] | None
+    takes_label: bool
+    choices: list[T.Any] | None
+    coerce: T.Callable[[T.Any], T.Any]
+    takes_lazy: bool = False
+
+    @property
+    def name(self) -> str:
+        return self.param.name
+
+
+@dataclass(frozen=True)
+class FormPlan:
+    """
+    Reflection results for a class, computed once and replayed each time a form for the class is built.
+
+    Args:
+        cls (type): The class the plan was compiled for.
+        name (str): Name of the class.
+        description (str | None): Description parsed from the docstring of the class.
+        params (dict[str, Parameter]): Parameters of the class constructor.
+        fields (dict[str, FieldPlan]): Field plans for the parameters.
+        has_init (bool): Whether the class has an `__init__` method.
+    """
+
+    cls: T.Type
+    name: str
+    description: str | None
+    params: dict[str, Parameter]
+    fields: dict[str, FieldPlan]
+    has_init: bool = True
+
+    @classmethod
+    def from_params(
+        cls,
+        target: T.Type,
+        params: dict[str, Parameter],
+        name: str | None = None,
+        description: str | None = None,
+        has_init: bool = True,
+    ) -> "FormPlan":
+        return cls(
+            cls=target,
+            name=name or target.__name__,
+            description=description,
+            params=params,
+            fields={k: compile_field(v) for k, v in params.items()},
+            has_init=has_init,
+        )
+
+    @cached_property
+    def schema_hash(self) -> str:
+        """Hash of the class name and the name, type and requiredness of every parameter."""
+        schema = [self.cls.__module__, self.cls.__qualname__]
+        schema += [[k, repr(v.type), v.is_required] for k, v in self.params.items()]
+        return hashlib.sha1(json.dumps(schema).encode()).hexdigest()[:16]
+
+
+def compile_field(param: Parameter) -> FieldPlan:
+    coerce = compile_coercer(param.type)
+    try:
+        elem = element_for_type(param.type)
+    except ValueError:
+        return FieldPlan(param=param, element=None, takes_label=False, choices=None, coerce=coerce)
+
+    choices = list(get_literal_choices(param.type)) if is_literal(param.type) else None
+    info = ELEMENT_REGISTRY.info(elem)  # type: ignore
+    return FieldPlan(
+        param=param,
+        element=elem,  # type: ignore
+        takes_label=info.takes_label,
+        choices=choices,
+        coerce=coerce,
+        takes_lazy=info.takes_lazy,
+    )
+
+
+def compile_class_plan(cls: T.Type) -> FormPlan:
+    obj = Class(cls)
+    init_method = obj.init_method
+    params = dict(init_method._parameters) if init_method else {}
+    if dataclasses.is_dataclass(cls):
+        for i in dataclasses.fields(cls):
+            if i.name in params and i.default_factory is not dataclasses.MISSING:
+                param = params[i.name]
+                params[i.name] = Parameter(
+                    name=param.name,
+                    kind=param.kind,
+                    type=param.type,
+                    default=DefaultFactory(i.default_factory),
+                    description=param.description,
+                    infer_type=False,
+                )
+    return FormPlan.from_params(
+        cls,
+        params,
+        name=obj.name,
+        description=obj.description,
+        has_init=init_method is not None,
+    )
+
+
+class FormPlanCache:
+    """
+    Bounded LRU cache of form plans.
+
+    Plans are keyed on the compiler and the module and qualified name of the class.
+    A cached plan is only reused if it was compiled for the very same class object,
+    so redefining a class (e.g. on reload) invalidates its plan.
+    Registering an input element in `ELEMENT_REGISTRY` invalidates all plans.
+    """
+
+    def __init__(self, maxsize: int = 256) -> None:
+        self.maxsize = maxsize
+        self._plans: OrderedDict[tuple, FormPlan] = OrderedDict()
+        self._registry_version = ELEMENT_REGISTRY.version
+
+    def __len__(self) -> int:
+        return len(self._plans)
+
+    def get(self, cls: T.Type, compiler: T.Callable[[T.Type], FormPlan]) -> FormPlan:
+        if self._registry_version != ELEMENT_REGISTRY.version:
+            self._plans.clear()
+            self._registry_version = ELEMENT_REGISTRY.version
+        key = (compiler, cls.__module__, cls.__qualname__)
+        plan = self._plans.get(key)
+        if plan is None or plan.cls is not cls:
+            plan = compiler(cls)
+            self._plans[key] = plan
+        self._plans.move_to_end(key)
+        if len(self._plans) > self.maxsize:
+            self._plans.popitem(last=False)
+        return plan
+
+    def clear(self) -> None:
+        self._plans.clear()
+
+
+FORM_PLANS = FormPlanCache()
+
+
+def get_form_plan(
+    cls: T.Type,
+    compiler: T.Callable[[T.Type], FormPlan] = compile_class_plan,
+) -> FormPlan:
+    return FORM_PLANS.get(cls, compiler)
+
+
+__all__ = [
+    "DefaultFactory",
+    "FieldPlan",
+    "FormPlan",
+    "FormPlanCache",
+    "FORM_PLANS",
+    "compile_field",
+    "compile_class_plan",
+    "get_default",
+    "get_form_plan",
+]
@@ -1,17 +1,26 @@
 try:
-    from pydantic import BaseModel
+    from pydantic import BaseModel, TypeAdapter, ValidationError
+    from pydantic_core import to_jsonable_python
 except ImportError:
     raise ImportError(
         "'nicegui_ext.auto.pydantic_element' module requires pydantic to be installed."
     )
+import asyncio
+import inspect
 import typing as T
+from functools import lru_cache
 
+from nicegui import ui
 from nicegui.element import Element
-from objinspect import Parameter
+from objinspect import Class, Parameter
 from objinspect.constants import EMPTY
 from objinspect.parameter import ParameterKind
 
 from nicegui_ext.auto.class_element import ClassElement
+from nicegui_ext.auto.list_element import ClassListElement
+from nicegui_ext.auto.plan import DefaultFactory, FormPlan, get_form_plan
+from nicegui_ext.auto.state import is_state
+from nicegui_ext.helpers import UNION_TYPES
 
 
 def get_pydantic_init_params(model: T.Type[BaseModel]) -> dict[str, Parameter]:
@@ -25,22 +34,76 @@ def get_pydantic_init_params(model: T.Type[BaseModel]) -> dict[str, Parameter]:
     """
 
     params = {}
-    for name in model.model_fields:
+    for name, field in model.model_fields.items():
+        if field.is_required():
+            default = EMPTY
+        elif field.default_factory is not None:
+            default = DefaultFactory(field.default_factory)
+        else:
+            default = field.default
         param = Parameter(
             name=name,
             kind=ParameterKind.POSITIONAL_OR_KEYWORD,
-            type=model.__annotations__[name],
-            default=model.model_fields[name].default
-            if not model.model_fields[name].is_required()
-            else EMPTY,
-            description=None,
+            type=field.annotation,
+            default=default,
+            description=field.description,
             infer_type=False,
         )
         params[name] = param
     return params
 
 
+def get_model_type(t: T.Any) -> T.Type[BaseModel] | None:
+    """Get the model class of a `Model` or `Model | None` type hint."""
+    if inspect.isclass(t) and issubclass(t, BaseModel):
+        return t
+    if T.get_origin(t) in UNION_TYPES:
+        args = [i for i in T.get_args(t) if i is not type(None)]
+        if len(args) == 1:
+            return get_model_type(args[0])
+    return None
+
+
+def get_model_list_type(t: T.Any) -> T.Type[BaseModel] | None:
+    """Get the item model class of a `list[Model]` or `list[Model] | None` type hint."""
+    if T.get_origin(t) in UNION_TYPES:
+        args = [i for i in T.get_args(t) if i is not type(None)]
+        return get_model_list_type(args[0]) if len(args) == 1 else None
+    if T.get_origin(t) is list and (args := T.get_args(t)):
+        return get_model_type(args[0])
+    return None
+
+
+def compile_pydantic_plan(model: T.Type[BaseModel]) -> FormPlan:
+    return FormPlan.from_params(
+        model,
+        get_pydantic_init_params(model),
+        description=Class(model).description,
+    )
+
+
+@lru_cache(maxsize=1024)
+def get_field_adapter(model: T.Type[BaseModel], name: str) -> TypeAdapter:
+    """Get a cached TypeAdapter that validates a single field of a model with its type and constraints."""
+    field_info = model.model_fields[name]
+    return TypeAdapter(T.Annotated[field_info.annotation, field_info])  # type: ignore
+
+
+class PydanticModelListElement(ClassListElement):
+    """A `ClassListElement` for Pydantic models."""
+
+    def get_form_plan(self) -> FormPlan:
+        return get_form_plan(self.cls, compile_pydantic_plan)
+
+
 class PydanticModelElement(ClassElement):
+    """
+    Form for a Pydantic model.
+
+    Fields of a model type get a nested form, and fields of a `list[Model]` type get a paged list editor.
+    Both are built when they are first expanded.
+    """
+
     def __init__(
         self,
         cls: T.Type,
@@ -53,7 +116,17 @@ class PydanticModelElement(ClassElement):
         extras: list[Element] | None = None,
         expandable: bool = False,
         width_class: str = "w-fit-content",
+        client_side_drag: bool = False,
+        lazy: bool = False,
+        validate_on_change: bool = True,
+        validation_debounce: float = 0.3,
     ) -> None:
+        self.validate_on_change = validate_on_change
+        self.validation_debounce = validation_debounce
+        self.field_errors: dict[str, str] = {}
+        self._validation_generation: dict[str, int] = {}
+        self.nested_fields: set[str] = set()
+        self.none_until_opened = False
         super().__init__(
             cls,
             title=title,
@@ -65,6 +138,8 @@ class PydanticModelElement(ClassElement):
             extras=extras,
             expandable=expandable,
             width_class=width_class,
+            client_side_drag=client_side_drag,
+            lazy=lazy,
         )
 
     def get_description(self, description: str | None) -> str | None:
@@ -74,15 +149,143 @@ class PydanticModelElement(ClassElement):
             return None
         return description
 
-    def get_init_params(self) -> dict[str, Parameter]:
-        return get_pydantic_init_params(self.cls)
+    def get_form_plan(self) -> FormPlan:
+        cls = self.cls.__class__ if self.is_instance else self.cls
+        return get_form_plan(cls, compile_pydantic_plan)
+
+    @property
+    def value(self) -> BaseModel | None:
+        """The model instance. Used when the form is nested in another form."""
+        if self.is_unset:
+            return None
+        return self.get_instance()
+
+    @value.setter
+    def value(self, obj: BaseModel | None) -> None:
+        if obj is None:
+            return
+        for name in self.plan.params:
+            if name in self.pending_values:
+                self.set_pending_value(name, getattr(obj, name))
+            elif name in self.field_elements:
+                self.field_elements[name].value = self.to_element_value(  # type: ignore
+                    name, getattr(obj, name)
+                )
+
+    @property
+    def is_unset(self) -> bool:
+        """Whether this is an optional nested model that was never opened, so its value is None."""
+        return self.none_until_opened and not self.is_built
+
+    def to_element_value(self, name: str, value: T.Any) -> T.Any:
+        if name in self.nested_fields:
+            return value
+        return super().to_element_value(name, value)
+
+    def is_nested_field(self, name: str) -> bool:
+        t = self.plan.params[name].type
+        return get_model_type(t) is not None or get_model_list_type(t) is not None
+
+    def get_field_state(self, name: str) -> T.Any:
+        if name in self.pending_values and self.is_nested_field(name):
+            return to_jsonable_python(self.pending_values[name])
+        element = self.field_elements.get(name)
+        if isinstance(element, PydanticModelElement) and element.is_unset:
+            return None
+        return super().get_field_state(name)
+
+    def set_field_state(self, name: str, value: T.Any) -> None:
+        element = self.field_elements.get(name)
+        if isinstance(element, PydanticModelElement):
+            element.none_until_opened = value is None
+            if value is None:
+                return
+        if is_state(value) or not self.is_nested_field(name):
+            return super().set_field_state(name, value)
+        value = get_field_adapter(self.plan.cls, name).validate_python(value)
+        if name in self.pending_values:
+            self.set_pending_value(name, value)
+        else:
+            self.field_elements[name].value = value  # type: ignore
+
+    def add_input_element_for_param(self, param: Parameter) -> None:
+        model = get_model_type(param.type)
+        item_model = get_model_list_type(param.type)
+        if model is None and item_model is None:
+            return super().add_input_element_for_param(param)
+
+        if param.name in self.pending_values:
+            value = self.pending_values.pop(param.name)
+        else:
+            value = self.get_initial_value(param)
+
+        self.nested_fields.add(param.name)
+        if model is not None:
+            element = PydanticModelElement(
+                value if isinstance(value, model) else model,
+                title=self.format_label(param.name),
+                expandable=True,
+                lazy=True,
+                validate_on_change=self.validate_on_change,
+                validation_debounce=self.validation_debounce,
+            )
+            element.none_until_opened = value is None
+        else:
+            with ui.expansion(self.format_label(param.name)).classes(self.width_class) as expansion:
+                element = PydanticModelListElement(item_model, value, lazy=True)
+            expansion.on_value_change(lambda e: e.value and element.ensure_rendered())
+        self.register_field(param.name, element)
+
+    def register_field(self, name: str, element: Element) -> None:
+        super().register_field(name, element)
+        if self.validate_on_change and hasattr(element, "on_value_change"):
+            element.on_value_change(lambda _: self._on_field_change(name))  # type: ignore
+
+    def validate_field(self, name: str) -> str | None:
+        """
+        Validate the value of a single field against its type and `Field` constraints.
+        Field and model validators of the model only run when the whole model is constructed.
+
+        Returns:
+            The error message, or None if the value is valid.
+        """
+        field = self.plan.fields[name]
+        value = self.get_field_value(name)
+        if value is None and field.param.is_required:
+            error = "Field required"
+        else:
+            try:
+                get_field_adapter(self.plan.cls, name).validate_python(field.coerce(value))
+                error = None
+            except ValidationError as e:
+                error = "; ".join(i["msg"] for i in e.errors())
+            except Exception as e:
+                error = str(e)
+        self.set_field_error(name, error)
+        return error
 
-    def build(self) -> None:
-        self.build_title_row()
+    def set_field_error(self, name: str, error: str | None) -> None:
+        """Show or clear the error message of a field."""
+        if error is None:
+            if self.field_errors.pop(name, None) is None:
+                return
+        else:
+            self.field_errors[name] = error
+        element = self.field_elements.get(name)
+        if element is None:
+            return
+        element = getattr(element, "text_input_element", element)  # DatePicker
+        element._props["error"] = error is not None
+        element._props["error-message"] = error
+        element.update()
 
-        for param in self.get_init_params().values():
-            with self.get_current_row():
-                self.add_input_element_for_param(param)
+    async def _on_field_change(self, name: str) -> None:
+        generation = self._validation_generation.get(name, 0) + 1
+        self._validation_generation[name] = generation
+        await asyncio.sleep(self.validation_debounce)
+        if self._validation_generation[name] != generation or self.is_deleted:
+            return
+        self.validate_field(name)
 
 
-__all__ = ["PydanticModelElement"]
+__all__ = ["PydanticModelElement", "PydanticModelListElement", "get_field_adapter"]
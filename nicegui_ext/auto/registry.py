@@ -0,0 +1,198 @@
+import datetime
+import typing as T
+from dataclasses import dataclass
+
+from nicegui import ui
+from nicegui.element import Element
+from objinspect import Class
+from objinspect.constants import EMPTY
+from objinspect.util import is_literal
+
+from nicegui_ext.ui import DatePicker
+
+INPUT_ELEMENTS = {
+    int: ui.number,
+    str: ui.input,
+    float: ui.number,
+    bool: ui.checkbox,
+    list: ui.textarea,
+    tuple: ui.textarea,
+    dict: ui.textarea,
+    datetime.date: DatePicker,
+    T.Literal: ui.select,
+}
+
+DEFAULT_VALUES = {
+    ui.number: 0,
+    ui.input: "",
+    ui.checkbox: False,
+    ui.textarea: "",
+    DatePicker: None,
+}
+
+_MISSING = object()
+
+
+@dataclass(frozen=True)
+class ElementInfo:
+    """
+    Capabilities of an input element class.
+
+    Args:
+        element (type[Element]): The element class.
+        takes_label (bool): Whether the constructor accepts a `label` argument.
+        takes_options (bool): Whether the constructor accepts an `options` argument.
+        takes_text (bool): Whether the constructor accepts a `text` argument.
+        takes_lazy (bool): Whether the constructor accepts a `lazy` argument. Forms pass `lazy=True`.
+        value_type (Any): Type hint of the `value` argument. EMPTY if it has none.
+        default_value (Any): Value the element is reset to when a form is cleared. None to keep the current value.
+    """
+
+    element: T.Type[Element]
+    takes_label: bool
+    takes_options: bool
+    takes_text: bool
+    takes_lazy: bool
+    value_type: T.Any
+    default_value: T.Any
+
+
+def inspect_element(element: T.Type[Element], default_value: T.Any = None) -> ElementInfo:
+    init_method = Class(element).init_method
+    params = {i.name: i for i in init_method.params} if init_method else {}
+    value_param = params.get("value")
+    return ElementInfo(
+        element=element,
+        takes_label="label" in params,
+        takes_options="options" in params,
+        takes_text="text" in params,
+        takes_lazy="lazy" in params,
+        value_type=value_param.type if value_param else EMPTY,
+        default_value=default_value,
+    )
+
+
+class ElementRegistry:
+    """
+    Maps type hints to input element classes and holds the capabilities of each element class.
+
+    Element capabilities are inspected once per class, on first use or in `warm_up()`.
+    Resolved type hints are cached until the mapping changes through `register()`.
+
+    Args:
+        elements (dict): Mapping of types to element classes. Registrations are written to it.
+        default_values (dict): Mapping of element classes to their reset values. Registrations are written to it.
+    """
+
+    def __init__(
+        self,
+        elements: dict[T.Any, T.Type[Element]],
+        default_values: dict[T.Type[Element], T.Any],
+    ) -> None:
+        self.elements = elements
+        self.default_values = default_values
+        self.version = 0
+        self.hits = 0
+        self.misses = 0
+        self._infos: dict[T.Type[Element], ElementInfo] = {}
+        self._resolved: dict[T.Any, T.Type[Element] | None] = {}
+
+    def register(
+        self,
+        t: T.Any,
+        element: T.Type[Element],
+        default_value: T.Any = _MISSING,
+    ) -> None:
+        """
+        Use an element class as the input element for a type.
+
+        Args:
+            t (Any): The type.
+            element (type[Element]): The element class.
+            default_value (Any, optional): Value the element is reset to when a form is cleared.
+        """
+        self.elements[t] = element
+        if default_value is not _MISSING:
+            self.default_values[element] = default_value
+        self._infos.pop(element, None)
+        self._resolved.clear()
+        self.version += 1
+
+    def info(self, element: T.Type[Element]) -> ElementInfo:
+        info = self._infos.get(element)
+        if info is not None:
+            self.hits += 1
+            return info
+        self.misses += 1
+        info = inspect_element(element, self.default_values.get(element))
+        self._infos[element] = info
+        return info
+
+    def default_value(self, element: T.Type[Element] | None) -> T.Any:
+        if element is None:
+            return None
+        return self.default_values.get(element)
+
+    def _resolve(self, t: T.Any) -> T.Type[Element] | None:
+        try:
+            if t in self.elements:
+                return self.elements[t]
+        except TypeError:  # unhashable type hint
+            pass
+        if T.get_origin(t) in self.elements:  # list[int], dict[str, int], ...
+            return self.elements[T.get_origin(t)]
+        if is_literal(t):
+            return self.elements[T.Literal]
+        for i in T.get_args(t):  # Optional[int], int | str, ...
+            if i is not type(None) and (element := self._resolve(i)) is not None:
+                return element
+        return None
+
+    def element_for_type(self, t: T.Any) -> T.Type[Element]:
+        try:
+            element = self._resolved[t]
+            self.hits += 1
+        except KeyError:
+            self.misses += 1
+            element = self._resolved[t] = self._resolve(t)
+        except TypeError:  # unhashable type hint
+            self.misses += 1
+            element = self._resolve(t)
+        if element is None:
+            raise ValueError(f"No input element for type {t}")
+        return element
+
+    def warm_up(self, types: T.Iterable[T.Any] = ()) -> None:
+        """Inspect every registered element class and resolve the given type hints ahead of time."""
+        for element in set(self.elements.values()):
+            self.info(element)
+        for t in types:
+            try:
+                self.element_for_type(t)
+            except ValueError:
+                pass
+
+    def stats(self) -> dict[str, int]:
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "elements": len(self._infos),
+            "types": len(self._resolved),
+        }
+
+    def clear_cache(self) -> None:
+        self._infos.clear()
+        self._resolved.clear()
+        self.hits = self.misses = 0
+
+
+ELEMENT_REGISTRY = ElementRegistry(INPUT_ELEMENTS, DEFAULT_VALUES)
+
+__all__ = [
+    "INPUT_ELEMENTS",
+    "DEFAULT_VALUES",
+    "ElementInfo",
+    "ElementRegistry",
+    "ELEMENT_REGISTRY",
+    "inspect_element",
+]
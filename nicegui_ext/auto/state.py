@@ -0,0 +1,44 @@
+import json
+import typing as T
+
+StateFormat = T.Literal["json", "msgpack"]
+
+
+def encode_state(state: dict[str, T.Any], format: StateFormat = "json") -> bytes:
+    """
+    Serialize a form state.
+    Values that can't be represented in the format are stored as strings.
+
+    Args:
+        state (dict): State returned by `get_state()` of a form.
+        format (str, optional): "json" or "msgpack". msgpack requires the `msgpack` package.
+    """
+    if format == "json":
+        return json.dumps(state, separators=(",", ":"), default=str).encode()
+    if format == "msgpack":
+        return _msgpack().packb(state, default=str)
+    raise ValueError(f"Invalid state format: {format}")
+
+
+def decode_state(data: bytes | str, format: StateFormat = "json") -> dict[str, T.Any]:
+    if format == "json":
+        return json.loads(data)
+    if format == "msgpack":
+        return _msgpack().unpackb(data)
+    raise ValueError(f"Invalid state format: {format}")
+
+
+def is_state(value: T.Any) -> bool:
+    """Check if a value is the state of a nested form or editor."""
+    return isinstance(value, dict) and "schema" in value
+
+
+def _msgpack():
+    try:
+        import msgpack
+    except ImportError:
+        raise ImportError("Form states in the msgpack format require msgpack to be installed.")
+    return msgpack
+
+
+__all__ = ["StateFormat", "encode_state", "decode_state", "is_state"]
@@ -1,11 +1,14 @@
 from __future__ import annotations
 
+import bisect
+import itertools
+import json
 import random
 import typing as T
+import weakref
 
-from nicegui import ui
-
-_dragged: Draggable | None = None
+from nicegui import Client, ui
+from nicegui.events import GenericEventArguments
 
 
 def check_type(t: T.Type, obj: T.Any) -> bool:
@@ -23,40 +26,151 @@ def check_type(t: T.Type, obj: T.Any) -> bool:
     return False
 
 
+class DragRegistry:
+    """
+    Keeps track of the card that is being dragged, separately for each client.
+
+    Both the clients and the cards are referenced weakly,
+    so entries of disconnected clients and deleted cards are garbage-collected.
+    """
+
+    def __init__(self) -> None:
+        self._dragged: weakref.WeakKeyDictionary[
+            Client, weakref.ref[Draggable]
+        ] = weakref.WeakKeyDictionary()
+
+    def __len__(self) -> int:
+        return len(self._dragged)
+
+    def get(self, client: Client) -> Draggable | None:
+        ref = self._dragged.get(client)
+        if ref is None:
+            return None
+        return ref()
+
+    def set(self, client: Client, element: Draggable) -> None:
+        self._dragged[client] = weakref.ref(element)
+
+    def pop(self, client: Client) -> Draggable | None:
+        ref = self._dragged.pop(client, None)
+        if ref is None:
+            return None
+        return ref()
+
+
+DRAG_STATE = DragRegistry()
+CLIENT_DROP_EVENT = "draggable_drop"
+
+
 class Draggable(ui.card):
     highlight_border = "border-2 border-blue-300"
     dragged_background = "bg-blue-950"
-
-    def __init__(self, enable_dragging: bool = True, width_class="w-fit-content") -> None:
+    drag_enabled = True
+
+    def __init__(
+        self,
+        enable_dragging: bool = True,
+        width_class="w-fit-content",
+        client_side: bool = False,
+    ) -> None:
+        """
+        Args:
+            enable_dragging (bool): Whether the card can be dragged.
+            width_class (str): Tailwind width class of the card.
+            client_side (bool): Handle highlighting and drag styling in the browser.
+                Only the final drop is sent to the server, as a single event.
+        """
         super().__init__()
         self.drag_enabled = enable_dragging
         self.width_class = width_class
+        self.client_side = client_side
 
         with self.props("draggable").classes(f"cursor-pointer").classes(self.width_class).style(
             "box-shadow: none;"
         ):
             self.build()
 
-        self.on("dragstart", self.on_dragstart)
-        self.on("dragenter", self.on_dragenter)
-        self.on("dragleave", self.on_dragleave)
-        self.on("dragover.prevent", self.on_dragover_prevent)
-        self.on("drop", self.on_drop)
+        if self.client_side:
+            self._add_client_side_handlers()
+        else:
+            self.on("dragstart", self.on_dragstart)
+            self.on("dragenter", self.on_dragenter)
+            self.on("dragleave", self.on_dragleave)
+            self.on("dragover.prevent", self.on_dragover_prevent)
+            self.on("drop", self.on_drop)
 
         if not self.drag_enabled:
             self.disable_drag()
 
+    def _add_client_side_handlers(self) -> None:
+        highlight = json.dumps(self.highlight_border.split())
+        dragged = json.dumps(self.dragged_background.split())
+        self.on(
+            "dragstart",
+            js_handler=f"""(e) => {{
+                e.stopPropagation();
+                e.dataTransfer.setData("text/plain", e.currentTarget.id);
+                e.currentTarget.classList.add(...{dragged});
+            }}""",
+        )
+        self.on(
+            "dragend",
+            js_handler=f"(e) => e.currentTarget.classList.remove(...{dragged})",
+        )
+        self.on(
+            "dragenter",
+            js_handler=f"""(e) => {{
+                if (e.currentTarget.hasAttribute("draggable")) e.currentTarget.classList.add(...{highlight});
+            }}""",
+        )
+        self.on(
+            "dragleave",
+            js_handler=f"""(e) => {{
+                if (!e.currentTarget.contains(e.relatedTarget)) e.currentTarget.classList.remove(...{highlight});
+            }}""",
+        )
+        self.on("dragover", js_handler="(e) => e.preventDefault()")
+        self.on(
+            "drop",
+            js_handler=f"""(e) => {{
+                e.preventDefault();
+                e.stopPropagation();
+                const target = e.currentTarget;
+                target.classList.remove(...{highlight});
+                const source = e.dataTransfer.getData("text/plain");
+                if (!target.hasAttribute("draggable") || !source || source === target.id) return;
+                const siblings = Array.from(target.parentNode.children).filter((c) => c.hasAttribute("draggable"));
+                target.dispatchEvent(new CustomEvent("{CLIENT_DROP_EVENT}", {{
+                    detail: {{
+                        source_id: Number(source.slice(1)),
+                        target_id: Number(target.id.slice(1)),
+                        target_index: siblings.indexOf(target),
+                    }},
+                }}));
+            }}""",
+        )
+        self.on(CLIENT_DROP_EVENT, self.on_client_drop, ["detail"])
+
     def disable_drag(self) -> None:
         self.drag_enabled = False
         self.classes(remove="cursor-pointer")
         self.props(remove="draggable")
+        self._update_parent_index()
 
     def enable_drag(self) -> None:
         self.drag_enabled = True
         self.classes(add="cursor-pointer")
         self.props(add="draggable")
+        self._update_parent_index()
+
+    def _update_parent_index(self) -> None:
+        parent = self.get_parent()
+        if isinstance(parent, DraggableContainer):
+            parent._on_drag_toggled(self)
 
     def get_parent(self) -> Column | Row | None:
+        if self.parent_slot is None:
+            return None
         return self.parent_slot.parent  # type:ignore
 
     def delete_from_parent(self) -> None:
@@ -72,9 +186,7 @@ class Draggable(ui.card):
             return
 
         self.classes(add=self.dragged_background)
-
-        global _dragged
-        _dragged = self
+        DRAG_STATE.set(self.client, self)
 
     def on_dragenter(self) -> None:
         if not self.drag_enabled:
@@ -92,59 +204,248 @@ class Draggable(ui.card):
         self.classes(remove=self.dragged_background)
         if not self.drag_enabled:
             return
-        global _dragged
-        if not _dragged:
+        dragged = DRAG_STATE.pop(self.client)
+        if dragged is None or dragged.is_deleted:
             return
 
-        parent = self.get_parent()
-        if parent is None:
+        if self.accept_drop(dragged):
+            self.on_dragleave()
+            dragged.classes(remove=self.dragged_background)
+
+    def on_client_drop(self, e: GenericEventArguments) -> None:
+        """
+        Handle a drop in client-side mode.
+        The event detail holds `source_id`, `target_id` and `target_index` as seen by the browser.
+        """
+        if not self.drag_enabled:
             return
+        detail = e.args.get("detail") or {}
+        dragged = self.client.elements.get(detail.get("source_id"))  # type: ignore
+        if not isinstance(dragged, Draggable) or not dragged.drag_enabled:
+            return
+        self.accept_drop(dragged)
+
+    def accept_drop(self, dragged: Draggable) -> bool:
+        """Move the dragged card to the position of this card. Returns True if it was moved."""
+        parent = self.get_parent()
+        if not isinstance(parent, DraggableContainer):
+            return False
 
-        children = parent.get_draggable_children()
         try:
-            self_index = children.index(self)
+            self_index = parent.draggable_position(self)
         except ValueError:
-            return
+            return False
 
-        _dragged.move(target_index=self_index)
-        self.on_dragleave()
-        _dragged.classes(remove=self.dragged_background)
+        dragged.move(target_index=self_index)
+        return True
 
     def on_dragover_prevent(self):
         """Prevent default dragover event to allow drop event"""
         return
 
 
-class Row(ui.row):
-    def get_draggable_children(self) -> list[Draggable]:
-        children = []
-        for i in self.default_slot.children:
-            if issubclass(i.__class__, Draggable):
-                if i.drag_enabled:  # type:ignore
-                    children.append(i)
-        return children
+class _DraggableChildren(list):
+    """
+    Children list of a container's default slot.
+    Notifies the container about changes so it can keep its draggable index up to date.
+    """
 
-    def shuffle(self) -> None:
-        children = self.get_draggable_children()
-        random.shuffle(children)
-        for i in children:
-            i.move(target_index=0)
+    def __init__(self, items: T.Iterable, container: DraggableContainer) -> None:
+        super().__init__(items)
+        self._container = container
+
+    def append(self, item: T.Any) -> None:
+        super().append(item)
+        self._container._on_child_inserted(item, len(self) - 1)
+
+    def insert(self, index: T.SupportsIndex, item: T.Any) -> None:
+        index = int(index)
+        if index < 0:
+            index = max(len(self) + index, 0)
+        index = min(index, len(self))
+        super().insert(index, item)
+        self._container._on_child_inserted(item, index)
+
+    def remove(self, item: T.Any) -> None:
+        position = self._container._indexed_position(item)
+        if position is None:
+            position = self.index(item)
+        list.__delitem__(self, position)
+        self._container._on_child_removed(item, position)
+
+    def _changed(self, *_) -> None:
+        self._container.invalidate_draggable_index()
+
+    def _wrap(name: str):  # type: ignore
+        method = getattr(list, name)
+
+        def wrapper(self, *args, **kwargs):
+            result = method(self, *args, **kwargs)
+            self._changed()
+            return result
+
+        wrapper.__name__ = name
+        return wrapper
+
+    pop = _wrap("pop")
+    clear = _wrap("clear")
+    extend = _wrap("extend")
+    sort = _wrap("sort")
+    reverse = _wrap("reverse")
+    __setitem__ = _wrap("__setitem__")
+    __delitem__ = _wrap("__delitem__")
+    __iadd__ = _wrap("__iadd__")
+    del _wrap
+
+
+class DraggableContainer:
+    """
+    Mixin for containers of draggable cards.
 
+    Keeps an index of the enabled draggable children (element id -> position in the default slot).
+    The index is updated in place when children are appended, inserted or removed
+    and when cards are enabled or disabled, so moving a card doesn't rescan the children.
+    It is rebuilt lazily after other changes of the children list.
+    """
+
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self._draggable: list[Draggable] = []  # ordered by position
+        self._positions: dict[int, int] | None = None
+        slot = self.default_slot  # type: ignore
+        slot.children = _DraggableChildren(slot.children, self)
+
+    def invalidate_draggable_index(self) -> None:
+        self._positions = None
+
+    def _find(self, position: int) -> int:
+        """Get the index in `_draggable` of the first card at or after a position in the default slot."""
+        positions = self._positions
+        return bisect.bisect_left(self._draggable, position, key=lambda i: positions[i.id])  # type: ignore
+
+    def _shift(self, start: int, offset: int) -> None:
+        positions = self._positions
+        for i in itertools.islice(self._draggable, start, None):
+            positions[i.id] += offset  # type: ignore
+
+    def _indexed_position(self, item: T.Any) -> int | None:
+        if self._positions is None or not isinstance(item, Draggable):
+            return None
+        return self._positions.get(item.id)
+
+    def _on_child_inserted(self, item: T.Any, position: int) -> None:
+        if self._positions is None:
+            return
+        k = self._find(position)
+        self._shift(k, 1)
+        # drag_enabled is True while a card is constructed, disable_drag updates the index
+        if isinstance(item, Draggable) and item.drag_enabled:
+            self._draggable.insert(k, item)
+            self._positions[item.id] = position
+
+    def _on_child_removed(self, item: T.Any, position: int) -> None:
+        if self._positions is None:
+            return
+        k = self._find(position)
+        if k < len(self._draggable) and self._draggable[k] is item:
+            del self._draggable[k]
+            del self._positions[item.id]
+        self._shift(k, -1)
+
+    def _on_drag_toggled(self, item: Draggable) -> None:
+        if self._positions is None:
+            return
+        position = self._positions.get(item.id)
+        if item.drag_enabled and position is None:
+            position = self.default_slot.children.index(item)  # type: ignore
+            self._draggable.insert(self._find(position), item)
+            self._positions[item.id] = position
+        elif not item.drag_enabled and position is not None:
+            del self._draggable[self._find(position)]
+            del self._positions[item.id]
+
+    def _draggable_index(self) -> dict[int, int]:
+        if self._positions is None:
+            self._draggable = []
+            self._positions = {}
+            for n, i in enumerate(self.default_slot.children):  # type: ignore
+                if isinstance(i, Draggable) and i.drag_enabled:
+                    self._draggable.append(i)
+                    self._positions[i.id] = n
+        return self._positions
 
-class Column(ui.column):
     def get_draggable_children(self) -> list[Draggable]:
-        children = []
-        for i in self.default_slot.children:
-            if issubclass(i.__class__, Draggable):
-                if i.drag_enabled:  # type:ignore
-                    children.append(i)
-        return children
+        self._draggable_index()
+        return self._draggable.copy()
+
+    def draggable_position(self, element: Draggable) -> int:
+        """Get the position of an enabled draggable child in the default slot."""
+        try:
+            return self._draggable_index()[element.id]
+        except KeyError:
+            raise ValueError(f"{element} is not an enabled draggable child of {self}")
+
+    def reorder(self, ids: T.Sequence[int]) -> None:
+        """
+        Reorder the enabled draggable children with a single update.
+
+        Args:
+            ids (Sequence[int]): Element ids in the new order. Draggable children that are not listed
+                keep their relative order after the listed ones. Other children keep their positions.
+        """
+        positions = self._draggable_index()
+        current = self._draggable
+        by_id = {i.id: i for i in current}
+        ordered = [by_id.pop(i) for i in ids if i in by_id]
+        ordered += [i for i in current if i.id in by_id]
+        children = self.default_slot.children  # type: ignore
+        slots = [positions[i.id] for i in current]
+        for position, element in zip(slots, ordered):
+            list.__setitem__(children, position, element)
+            positions[element.id] = position
+        self._draggable = ordered
+        self.update()  # type: ignore
+
+    def move_many(self, elements: T.Sequence[Draggable], target_index: int = -1) -> None:
+        """
+        Move several draggable cards into this container as one block, with one update per container.
+
+        Args:
+            elements (Sequence[Draggable]): The cards to move, in order. They can come from other containers.
+            target_index (int): Position in the default slot, after the cards are taken out of it.
+                Defaults to -1 (append to the end).
+        """
+        sources: dict[int, T.Any] = {}
+        for element in elements:
+            parent = element.parent_slot.parent  # type: ignore
+            element.parent_slot.children.remove(element)  # type: ignore
+            sources[parent.id] = parent
+
+        slot = self.default_slot  # type: ignore
+        if target_index < 0:
+            target_index = len(slot.children)
+        slot.children[target_index:target_index] = elements
+        for element in elements:
+            element.parent_slot = slot
+
+        for parent in sources.values():
+            if parent is not self:
+                parent.update()
+        self.update()  # type: ignore
 
     def shuffle(self) -> None:
-        children = self.get_draggable_children()
-        random.shuffle(children)
-        for i in children:
-            i.move(target_index=0)
+        """Shuffle the enabled draggable children in place. Other children keep their positions."""
+        ids = [i.id for i in self.get_draggable_children()]
+        random.shuffle(ids)
+        self.reorder(ids)
+
+
+class Row(DraggableContainer, ui.row):
+    pass
+
+
+class Column(DraggableContainer, ui.column):
+    pass
 
 
-__all__ = ["Draggable", "Column", "Row"]
+__all__ = ["Draggable", "DraggableContainer", "Column", "Row"]
@@ -0,0 +1,283 @@
+import asyncio
+import fnmatch
+import itertools
+import os
+import threading
+import typing as T
+from collections import OrderedDict
+from dataclasses import dataclass
+
+from nicegui import run, ui
+
+from nicegui_ext import icons
+from nicegui_ext.native_file_picker import ALL_FILES, NativeFilePickerElement
+from nicegui_ext.ui import Dialog, notification
+
+
+@dataclass(frozen=True)
+class DirEntry:
+    name: str
+    path: str
+    is_dir: bool
+
+
+class DirectoryListingCache:
+    """
+    Thread-safe LRU cache of directory listings.
+    A cached listing is reused as long as the modification time of the directory is unchanged.
+
+    Args:
+        maxsize (int): Maximum number of cached directories.
+    """
+
+    def __init__(self, maxsize: int = 64) -> None:
+        self.maxsize = maxsize
+        self._listings: OrderedDict[str, tuple[int, list[DirEntry]]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def list(self, path: str) -> list[DirEntry]:
+        """List a directory. Directories come first, then files, both sorted by name."""
+        path = os.path.abspath(path)
+        mtime = os.stat(path).st_mtime_ns
+        with self._lock:
+            cached = self._listings.get(path)
+            if cached is not None and cached[0] == mtime:
+                self._listings.move_to_end(path)
+                return cached[1]
+
+        entries = []
+        with os.scandir(path) as it:
+            for i in it:
+                try:
+                    is_dir = i.is_dir()
+                except OSError:
+                    is_dir = False
+                entries.append(DirEntry(name=i.name, path=i.path, is_dir=is_dir))
+        entries.sort(key=lambda e: (not e.is_dir, e.name.lower()))
+
+        with self._lock:
+            self._listings[path] = (mtime, entries)
+            self._listings.move_to_end(path)
+            if len(self._listings) > self.maxsize:
+                self._listings.popitem(last=False)
+        return entries
+
+    def clear(self) -> None:
+        with self._lock:
+            self._listings.clear()
+
+
+LISTING_CACHE = DirectoryListingCache()
+
+
+def matches_filetypes(name: str, filetypes: list[tuple[str, str]]) -> bool:
+    """Check a file name against tkinter-style filetypes, e.g. [("Text files", "*.txt *.md")]."""
+    for _, patterns in filetypes:
+        for pattern in patterns.replace(";", " ").split():
+            if pattern in ("*", "*.*") or fnmatch.fnmatch(name, pattern):
+                return True
+    return False
+
+
+class ServerFileDialog:
+    """
+    A file and directory browser that lists the file system of the server.
+    Works in headless deployments, where `NativeFileDialog` is not available.
+    Has the same selection semantics as `NativeFileDialog`.
+
+    The browser is confined to a root directory. Paths are resolved with `os.path.realpath`,
+    so symlinks that point outside of the root can't be opened or selected either.
+
+    Args:
+        root (str, optional): Directory the browser is confined to. Defaults to the initial directory.
+            Pass "/" to allow the whole file system.
+    """
+
+    def __init__(
+        self,
+        select: T.Literal["file", "dir"] = "file",
+        multiple: bool = False,
+        title_open: str | None = None,
+        filetypes: list[tuple[str, str]] = [ALL_FILES],
+        initial_directory: str | None = None,
+        open_at_last_dir: bool = True,
+        page_size: int = 200,
+        root: str | None = None,
+    ):
+        self.select = select
+        if self.select not in ["file", "dir"]:
+            raise ValueError("Invalid selection type. Choose 'file' or 'dir'.")
+        self.multiple = multiple
+        self.title_open = (
+            title_open or f"Select file{'s' if multiple else ''}"
+            if select == "file"
+            else "Select a directory"
+        )
+        self.filetypes = filetypes
+        self.open_at_last_dir = open_at_last_dir
+        self.page_size = page_size
+
+        self.last_dir = ""
+        self.chosen = None
+        self.initial_dir = os.path.realpath(initial_directory or os.getcwd())
+        self.root = os.path.realpath(root) if root else self.initial_dir
+        if not self.is_allowed(self.initial_dir):
+            raise ValueError(f"Initial directory '{self.initial_dir}' is outside of '{self.root}'")
+
+    def is_allowed(self, path: str) -> bool:
+        """Check whether a path resolves to the root or to a path inside it."""
+        path = os.path.realpath(path)
+        return os.path.commonpath([path, self.root]) == self.root
+
+    def _get_dir(self) -> str:
+        if not self.open_at_last_dir or not self.last_dir:
+            return self.initial_dir
+        return self.last_dir
+
+    def _visible_entries(self, entries: list[DirEntry]) -> T.Iterator[DirEntry]:
+        for i in entries:
+            if i.is_dir:
+                yield i
+            elif self.select == "file" and matches_filetypes(i.name, self.filetypes):
+                yield i
+
+    async def open_async(self, timeout: float | None = None):
+        """
+        Show the browser and wait for a selection.
+
+        Returns:
+            The selected path, a tuple of paths if `multiple` is set, or None if the dialog was closed.
+
+        Raises:
+            asyncio.TimeoutError: If nothing was selected within the timeout.
+        """
+        current_dir = self._get_dir()
+        pending: T.Iterator[DirEntry] = iter(())
+        selected: dict[str, None] = {}
+
+        with Dialog() as dialog, ui.card().classes("w-[40rem] max-w-full"):
+            ui.label(self.title_open).classes("text-lg font-semibold")
+            with ui.row().classes("items-center w-full no-wrap"):
+                up_button = ui.button(
+                    icon="arrow_upward", on_click=lambda: navigate(os.path.dirname(current_dir))
+                ).props("flat round")
+                path_label = ui.label().classes("font-mono break-all")
+            with ui.scroll_area().classes("h-96 w-full") as scroll_area:
+                entries_column = ui.column().classes("w-full gap-1")
+                more_button = ui.button("Load more", on_click=lambda: load_page()).props("flat")
+            with ui.row().classes("items-center"):
+                if self.select == "dir" or self.multiple:
+                    ui.button("Select", icon=icons.DONE, on_click=lambda: submit())
+                ui.button(icon=icons.CLOSE, on_click=dialog.close)
+
+        def submit(path: str | None = None):
+            paths = [path] if path is not None else list(selected)
+            if not all(self.is_allowed(i) for i in paths):
+                notification(f"Can't select files outside of '{self.root}'", type="warning")
+            elif path is not None:
+                dialog.submit(path)
+            elif self.select == "dir":
+                dialog.submit(current_dir)
+            elif selected:
+                dialog.submit(tuple(selected))
+            else:
+                notification("No file selected", type="warning")
+
+        def toggle(path: str, value: bool):
+            if value:
+                selected[path] = None
+            else:
+                selected.pop(path, None)
+
+        def add_entry(entry: DirEntry):
+            with ui.row().classes("items-center w-full no-wrap cursor-pointer") as row:
+                if entry.is_dir:
+                    ui.icon(icons.FOLDER)
+                    row.on("click", lambda: navigate(entry.path))
+                elif self.multiple:
+                    ui.checkbox(
+                        value=entry.path in selected,
+                        on_change=lambda e: toggle(entry.path, e.value),
+                    ).props("dense")
+                else:
+                    ui.icon("description")
+                    row.on("click", lambda: submit(entry.path))
+                ui.label(entry.name).classes("font-mono")
+
+        def load_page():
+            page = list(itertools.islice(pending, self.page_size))
+            with entries_column:
+                for entry in page:
+                    add_entry(entry)
+            more_button.set_visibility(len(page) == self.page_size)
+
+        async def navigate(path: str):
+            nonlocal current_dir, pending
+            path = os.path.realpath(path)
+            if not self.is_allowed(path):
+                notification(f"Can't open '{path}', it is outside of '{self.root}'", type="warning")
+                return
+            try:
+                entries = await run.io_bound(LISTING_CACHE.list, path)
+            except OSError as e:
+                notification(f"Cannot open '{path}': {e.strerror}", type="warning")
+                return
+            current_dir = path
+            path_label.text = current_dir
+            up_button.set_enabled(current_dir != self.root)
+            pending = self._visible_entries(entries or [])
+            entries_column.clear()
+            load_page()
+
+        def on_scroll(e):
+            if e.args["verticalPercentage"] >= 0.9 and more_button.visible:
+                load_page()
+
+        scroll_area.on("scroll", on_scroll, args=["verticalPercentage"], throttle=0.2)
+        await navigate(current_dir)
+        try:
+            result = await asyncio.wait_for(dialog, timeout)
+        finally:
+            dialog.delete()
+
+        if result:
+            first = result[0] if isinstance(result, tuple) else result
+            self.last_dir = first if self.select == "dir" else os.path.dirname(first)
+            self.chosen = result
+        return result
+
+
+class ServerFilePickerElement(NativeFilePickerElement):
+    """
+    A `NativeFilePickerElement` that browses the file system of the server instead of opening a Tk dialog.
+    Typed paths outside of the root are shown as missing, and `value` is None for them.
+
+    Args:
+        root (str, optional): Directory the browser is confined to. See `ServerFileDialog`.
+    """
+
+    def __init__(self, *args, root: str | None = None, **kwargs) -> None:
+        self.root = root
+        super().__init__(*args, **kwargs)
+
+    def create_file_dialog(self, **kwargs) -> ServerFileDialog:  # type: ignore
+        return ServerFileDialog(root=self.root, **kwargs)
+
+    def path_exists(self, path: str) -> bool:
+        return self.file_dialog.is_allowed(path) and super().path_exists(path)
+
+    @property
+    def value(self):
+        value = self.path_input.value
+        if value and not self.file_dialog.is_allowed(value):
+            return None
+        return value
+
+
+__all__ = [
+    "DirEntry",
+    "DirectoryListingCache",
+    "LISTING_CACHE",
+    "ServerFileDialog",
+    "ServerFilePickerElement",
+]
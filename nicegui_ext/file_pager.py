@@ -0,0 +1,119 @@
+import codecs
+import mmap
+import os
+
+DEFAULT_CHUNK_SIZE = 64 * 1024
+MAX_LINE_SEARCH = 4096
+
+
+def read_text(
+    path: str,
+    max_bytes: int | None = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    encoding: str = "utf-8",
+) -> tuple[str, bool]:
+    """
+    Read a text file in chunks.
+
+    Args:
+        path (str): Path to the file.
+        max_bytes (int, optional): Stop reading after this many bytes. Defaults to reading the whole file.
+        chunk_size (int, optional): Number of bytes read at a time.
+        encoding (str, optional): Text encoding of the file. Undecodable bytes are replaced.
+
+    Returns:
+        The text and whether it was truncated.
+    """
+    decoder = codecs.getincrementaldecoder(encoding)(errors="replace")
+    parts = []
+    total = 0
+    with open(path, "rb") as f:
+        while True:
+            size = chunk_size if max_bytes is None else min(chunk_size, max_bytes - total)
+            if size <= 0:
+                break
+            chunk = f.read(size)
+            if not chunk:
+                break
+            total += len(chunk)
+            parts.append(decoder.decode(chunk))
+        truncated = max_bytes is not None and bool(f.read(1))
+    if not truncated:
+        parts.append(decoder.decode(b"", final=True))
+    return "".join(parts), truncated
+
+
+class FilePager:
+    """
+    Memory-mapped view of a text file that is read one page at a time.
+
+    Pages end at a line break when there is one close to the page size,
+    so lines and multi-byte characters are rarely split between pages.
+
+    Args:
+        path (str): Path to the file.
+        page_size (int, optional): Approximate number of bytes per page.
+        encoding (str, optional): Text encoding of the file. Undecodable bytes are replaced.
+    """
+
+    def __init__(self, path: str, page_size: int = 1024 * 1024, encoding: str = "utf-8") -> None:
+        self.path = path
+        self.page_size = page_size
+        self.encoding = encoding
+        self.size = os.path.getsize(path)
+        self._file = open(path, "rb")
+        self._mmap = (
+            mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ) if self.size else None
+        )
+        self._offsets = [0]
+
+    def __enter__(self) -> "FilePager":
+        return self
+
+    def __exit__(self, *_) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        """Estimated number of pages."""
+        return max(1, -(-self.size // self.page_size))
+
+    def close(self) -> None:
+        if self._mmap is not None:
+            self._mmap.close()
+            self._mmap = None
+        self._file.close()
+
+    def _page_end(self, start: int) -> int:
+        end = start + self.page_size
+        if end >= self.size:
+            return self.size
+        newline = self._mmap.find(b"\n", end, min(end + MAX_LINE_SEARCH, self.size))  # type: ignore
+        return newline + 1 if newline != -1 else end
+
+    def page_bounds(self, index: int) -> tuple[int, int]:
+        """Get the byte offsets (start, end) of a page."""
+        if index < 0:
+            raise IndexError(index)
+        while len(self._offsets) <= index + 1 and self._offsets[-1] < self.size:
+            self._offsets.append(self._page_end(self._offsets[-1]))
+        if index + 1 >= len(self._offsets):
+            if index == 0:
+                return 0, 0
+            raise IndexError(index)
+        return self._offsets[index], self._offsets[index + 1]
+
+    def has_page(self, index: int) -> bool:
+        try:
+            start, end = self.page_bounds(index)
+        except IndexError:
+            return False
+        return index == 0 or end > start
+
+    def read_page(self, index: int) -> str:
+        start, end = self.page_bounds(index)
+        if self._mmap is None:
+            return ""
+        return self._mmap[start:end].decode(self.encoding, errors="replace")
+
+
+__all__ = ["read_text", "FilePager"]
@@ -1,8 +1,10 @@
+import types
 import typing as T
-from functools import lru_cache
+from contextlib import contextmanager
+from functools import lru_cache, partial
 
 from nicegui.element import Element
-from objinspect import Class, Parameter
+from objinspect import Parameter
 from objinspect.util import get_literal_choices, is_pure_literal, type_to_str
 from stdl import dt, st
 
@@ -23,34 +25,153 @@ def clean_variable_name(name: str) -> str:
     return st.snake_case(name).replace("_", " ").title()
 
 
-def is_type(val: T.Any, t: T.Type) -> bool:
-    """
-    Note: not fully implemented. Only supports basic types.
-    """
+UNION_TYPES = (T.Union, types.UnionType)
+
+Validator = T.Callable[[T.Any], bool]
+
+
+def _always_valid(value: T.Any) -> bool:
+    return True
+
+
+def _never_valid(value: T.Any) -> bool:
+    return False
+
+
+def _compile_items_validator(t: T.Any) -> T.Callable[[T.Iterable], bool]:
+    """Compile a validator for all items of a container at once."""
+    if t is T.Any:
+        return _always_valid
+    if T.get_origin(t) is T.Annotated:
+        return _compile_items_validator(T.get_args(t)[0])
+
+    if isinstance(t, type) and T.get_origin(t) is None:
+        # Check each distinct item type once instead of every item
+        return lambda items: all(issubclass(i, t) for i in set(map(type, items)))
+
     if is_pure_literal(t):
-        return val in get_literal_choices(t)
+        try:
+            choices = frozenset(get_literal_choices(t))
+        except TypeError:  # unhashable choices
+            pass
+        else:
+
+            def validate_literals(items: T.Iterable) -> bool:
+                try:
+                    return choices.issuperset(items)
+                except TypeError:
+                    return False
+
+            return validate_literals
+
+    validate = compile_validator(t)
+    return lambda items: all(map(validate, items))
+
+
+def _compile_validator(t: T.Any) -> Validator:
+    if t is T.Any:
+        return _always_valid
+    if is_pure_literal(t):
+        choices = get_literal_choices(t)
+        return lambda value: value in choices
+
     origin = T.get_origin(t)
     args = T.get_args(t)
-
     if origin is None:
-        return isinstance(val, t)
-    elif origin is T.Union:
-        return any(is_type(val, arg) for arg in args)
-    else:
-        if not isinstance(val, origin):
-            return False
-        if args:
-            return all(is_type(val, arg) for arg in args)
-        return True
+        if not isinstance(t, type):
+            return _never_valid
+        return lambda value: isinstance(value, t)  # includes Enum subclasses
 
+    if origin is T.Annotated:
+        return compile_validator(args[0])
 
-@lru_cache()
-def element_init_takes_label(e: Element) -> bool:
-    obj = Class(e)
-    init_method = obj.init_method
-    if not init_method:
-        return False
-    for i in init_method.params:
-        if i.name == "label":
-            return True
-    return False
+    if origin in UNION_TYPES:
+        validators = [compile_validator(i) for i in args]
+        return lambda value: any(validate(value) for validate in validators)
+
+    if not isinstance(origin, type):
+        return _never_valid
+    if not args:
+        return lambda value: isinstance(value, origin)
+
+    if origin is tuple and not (len(args) == 2 and args[1] is Ellipsis):
+        validators = [compile_validator(i) for i in args]
+        return lambda value: (
+            isinstance(value, tuple)
+            and len(value) == len(validators)
+            and all(validate(i) for validate, i in zip(validators, value))
+        )
+
+    if issubclass(origin, (list, tuple, set, frozenset)):
+        validate_items = _compile_items_validator(args[0])
+        return lambda value: isinstance(value, origin) and validate_items(value)
+
+    if issubclass(origin, dict) and len(args) == 2:
+        validate_keys = _compile_items_validator(args[0])
+        validate_values = _compile_items_validator(args[1])
+        return lambda value: (
+            isinstance(value, origin)
+            and validate_keys(value.keys())
+            and validate_values(value.values())
+        )
+
+    return lambda value: isinstance(value, origin)
+
+
+@lru_cache(maxsize=512)
+def _compile_validator_cached(t: T.Any) -> Validator:
+    return _compile_validator(t)
+
+
+def compile_validator(t: T.Any) -> Validator:
+    """
+    Compile a type hint into a callable that checks if a value has the hinted type.
+
+    Supports plain classes (including Enum), Any, Literal, Union/Optional, Annotated,
+    and list, tuple, set, frozenset and dict with element types.
+    Containers with items of a plain class are checked once per distinct item type, not per item.
+    Validators are cached for hashable type hints.
+    """
+    try:
+        return _compile_validator_cached(t)
+    except TypeError:  # unhashable type hint
+        return _compile_validator(t)
+
+
+def is_type(val: T.Any, t: T.Type) -> bool:
+    return compile_validator(t)(val)
+
+
+def element_init_takes_label(e: T.Type[Element]) -> bool:
+    from nicegui_ext.auto.registry import ELEMENT_REGISTRY
+
+    return ELEMENT_REGISTRY.info(e).takes_label
+
+
+@contextmanager
+def batch_updates(element: Element) -> T.Iterator[Element]:
+    """
+    Coalesce client updates of an element and its descendants.
+
+    Inside the context, `update()` calls on the element and its descendants are only recorded.
+    Each element that requested an update is updated once when the context exits.
+    Elements created inside the context are not affected.
+
+    Example:
+        >>> with batch_updates(form):
+        ...     form.clear_fields()
+    """
+    pending: dict[int, Element] = {}
+    patched: list[Element] = []
+    for e in element.descendants(include_self=True):
+        if "update" in e.__dict__:  # batched by an outer context
+            continue
+        e.update = partial(pending.setdefault, e.id, e)  # type: ignore
+        patched.append(e)
+    try:
+        yield element
+    finally:
+        for e in patched:
+            del e.update
+        for e in pending.values():
+            e.update()
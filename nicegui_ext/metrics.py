@@ -0,0 +1,219 @@
+import json
+import threading
+import time
+import typing as T
+import weakref
+from contextlib import contextmanager, nullcontext
+from dataclasses import asdict, dataclass
+from functools import wraps
+
+from nicegui import Client, context
+from nicegui.element import Element
+
+_NULL_CONTEXT = nullcontext()
+
+
+@dataclass
+class ComponentStats:
+    """
+    Counters for a single component.
+
+    Args:
+        constructions (int): Number of times the component was constructed or opened.
+        construction_seconds (float): Total time spent constructing the component.
+        elements_created (int): Total number of elements created during construction, including the component itself.
+        initial_bytes (int): Approximate size of the created elements when they are sent to the browser.
+        update_calls (int): Number of `Element.update()` calls on the component and its elements.
+            The outbox merges the updates of an element within one tick, so fewer messages may be sent.
+        update_call_bytes (int): Approximate size of the updated elements, summed over the calls.
+    """
+
+    constructions: int = 0
+    construction_seconds: float = 0.0
+    elements_created: int = 0
+    initial_bytes: int = 0
+    update_calls: int = 0
+    update_call_bytes: int = 0
+
+
+def _payload_size(element: Element) -> int:
+    return len(json.dumps(element._to_dict(), default=str))
+
+
+def _iter_subclasses(cls: T.Type) -> T.Iterator[T.Type]:
+    yield cls
+    for i in cls.__subclasses__():
+        yield from _iter_subclasses(i)
+
+
+class MetricsRegistry:
+    """
+    In-process registry of render metrics for `nicegui_ext` components.
+
+    Metrics are opt-in. While disabled, no method of any element is wrapped,
+    and dialogs only check the `enabled` flag.
+    Calling `enable()` wraps `__init__` of the registered classes and their subclasses, and `Element.update`.
+    Calling `disable()` restores the original methods.
+    """
+
+    def __init__(self) -> None:
+        self.enabled = False
+        self.stats: dict[str, ComponentStats] = {}
+        self.classes: list[T.Type[Element]] = []
+        self._originals: dict[tuple[T.Type, str], T.Callable] = {}
+        self._owners: weakref.WeakKeyDictionary[
+            Client, dict[int, str]
+        ] = weakref.WeakKeyDictionary()
+        self._constructing: set[int] = set()
+        self._lock = threading.Lock()
+
+    def register(self, cls: T.Type[Element]) -> None:
+        """Collect metrics for a component class and its subclasses."""
+        if cls in self.classes:
+            return
+        self.classes.append(cls)
+        if self.enabled:
+            self._patch_class(cls)
+
+    def register_defaults(self) -> None:
+        from nicegui_ext.auto.auto_element import AutoElement
+        from nicegui_ext.draggable import Draggable
+        from nicegui_ext.ui import DatePicker, TextareaDialog
+
+        for i in [AutoElement, Draggable, DatePicker, TextareaDialog]:
+            self.register(i)
+
+    def enable(self) -> None:
+        if self.enabled:
+            return
+        if not self.classes:
+            self.register_defaults()
+        for cls in self.classes:
+            self._patch_class(cls)
+        self._patch(Element, "update", self._wrap_update)
+        self.enabled = True
+
+    def disable(self) -> None:
+        if not self.enabled:
+            return
+        for (cls, name), original in self._originals.items():
+            setattr(cls, name, original)
+        self._originals.clear()
+        self._owners.clear()
+        self.enabled = False
+
+    def reset(self) -> None:
+        with self._lock:
+            self.stats.clear()
+
+    def get(self, name: str) -> ComponentStats:
+        with self._lock:
+            if name not in self.stats:
+                self.stats[name] = ComponentStats()
+            return self.stats[name]
+
+    def measure(self, name: str) -> T.ContextManager:
+        """Measure the construction of a component that is not a class, e.g. a dialog."""
+        if not self.enabled:
+            return _NULL_CONTEXT
+        return self._measure(name)
+
+    @contextmanager
+    def _measure(self, name: str) -> T.Iterator[None]:
+        try:
+            client = context.client
+        except RuntimeError:
+            client = None
+        first_id = client.next_element_id if client else 0
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self._record_construction(name, time.perf_counter() - start, client, first_id)
+
+    def _record_construction(
+        self, name: str, seconds: float, client: Client | None, first_id: int
+    ) -> None:
+        n_created = 0
+        n_bytes = 0
+        if client is not None:
+            owners = self._owners.setdefault(client, {})
+            for i in range(first_id, client.next_element_id):
+                element = client.elements.get(i)
+                if element is None:
+                    continue
+                n_created += 1
+                n_bytes += _payload_size(element)
+                owners.setdefault(i, name)  # nested components keep their own elements
+
+        stats = self.get(name)
+        with self._lock:
+            stats.constructions += 1
+            stats.construction_seconds += seconds
+            stats.elements_created += n_created
+            stats.initial_bytes += n_bytes
+
+    def _patch(self, cls: T.Type, name: str, wrapper: T.Callable) -> None:
+        if (cls, name) in self._originals:
+            return
+        original = cls.__dict__[name]
+        self._originals[(cls, name)] = original
+        setattr(cls, name, wrapper(original))
+
+    def _patch_class(self, cls: T.Type) -> None:
+        for i in _iter_subclasses(cls):
+            if "__init__" in i.__dict__:
+                self._patch(i, "__init__", self._wrap_init)
+
+    def _wrap_init(self, init: T.Callable) -> T.Callable:
+        @wraps(init)
+        def __init__(element, *args, **kwargs):
+            key = id(element)
+            if key in self._constructing:  # super().__init__ of a wrapped class
+                return init(element, *args, **kwargs)
+            self._constructing.add(key)
+            try:
+                with self._measure(type(element).__name__):
+                    init(element, *args, **kwargs)
+            finally:
+                self._constructing.discard(key)
+
+        return __init__
+
+    def _wrap_update(self, update: T.Callable) -> T.Callable:
+        @wraps(update)
+        def wrapper(element: Element) -> None:
+            owners = self._owners.get(element.client)
+            name = owners.get(element.id) if owners else None
+            if name is not None:
+                stats = self.get(name)
+                n_bytes = _payload_size(element)
+                with self._lock:
+                    stats.update_calls += 1
+                    stats.update_call_bytes += n_bytes
+            update(element)
+
+        return wrapper
+
+    def to_dict(self) -> dict[str, dict[str, T.Any]]:
+        with self._lock:
+            return {k: asdict(v) for k, v in self.stats.items()}
+
+    def to_json(self, indent: int | None = None) -> str:
+        return json.dumps(self.to_dict(), indent=indent)
+
+    def to_prometheus(self, prefix: str = "nicegui_ext") -> str:
+        """Export the metrics in the Prometheus text format."""
+        data = self.to_dict()
+        lines = []
+        for field in ComponentStats.__dataclass_fields__:
+            metric = f"{prefix}_{field}_total"
+            lines.append(f"# TYPE {metric} counter")
+            for component, values in data.items():
+                lines.append(f'{metric}{{component="{component}"}} {values[field]}')
+        return "\n".join(lines) + "\n"
+
+
+METRICS = MetricsRegistry()
+
+__all__ = ["ComponentStats", "MetricsRegistry", "METRICS"]
@@ -1,25 +1,124 @@
-try:
-    import tkinter as tk
-    from tkinter import filedialog
-except ImportError:
-    raise ImportError("'nicegui_ext.native_file_picker' module requires tkinter to be installed. ")
+import asyncio
 import os
+import queue
+import threading
+import time
 import typing as T
+from collections import OrderedDict
+from concurrent.futures import Future
 
-from nicegui import ui
+from nicegui import run, ui
 from nicegui.element import Element
 from stdl import fs
 
 from nicegui_ext import icons
 
-_TKINTER_ROOT = tk.Tk()
-_TKINTER_ROOT.withdraw()
+if T.TYPE_CHECKING:
+    import tkinter as tk
 
 ALL_FILES = ("All files", "*.*")
 TEXT_FILES = ("Text files", "*.txt")
 PYTHON_FILES = ("Python files", "*.py")
 
 
+class TkThread:
+    """
+    Runs tkinter work on a single dedicated thread.
+
+    Tk objects may only be used from the thread that created them,
+    so the root window is created on this thread and all dialogs are shown from it.
+    Jobs are executed one at a time, in the order they were submitted.
+    tkinter is imported and the root window is created when the first job is submitted.
+    """
+
+    def __init__(self) -> None:
+        self._jobs: queue.Queue[tuple[Future, T.Callable[["tk.Tk"], T.Any]]] = queue.Queue()
+        self._thread: threading.Thread | None = None
+        self._lock = threading.Lock()
+
+    def _ensure_started(self) -> None:
+        with self._lock:
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="tkinter", daemon=True)
+                self._thread.start()
+
+    def _run(self) -> None:
+        error: Exception | None = None
+        root = None
+        try:
+            import tkinter as tk
+        except ImportError:
+            error = ImportError(
+                "'nicegui_ext.native_file_picker' module requires tkinter to be installed."
+            )
+        else:
+            try:
+                root = tk.Tk()
+                root.withdraw()
+            except Exception as e:
+                error = e
+
+        while True:
+            future, fn = self._jobs.get()
+            if not future.set_running_or_notify_cancel():
+                continue
+            if error is not None:
+                future.set_exception(error)
+                continue
+            try:
+                future.set_result(fn(root))  # type: ignore
+            except BaseException as e:
+                future.set_exception(e)
+
+    def submit(self, fn: T.Callable[["tk.Tk"], T.Any]) -> Future:
+        """Queue a function that takes the Tk root window. Returns a future with its result."""
+        self._ensure_started()
+        future: Future = Future()
+        self._jobs.put((future, fn))
+        return future
+
+
+_TK_THREAD = TkThread()
+
+
+class PathExistsCache:
+    """
+    Small thread-safe cache of path existence checks.
+
+    Args:
+        ttl (float): Seconds a result stays valid.
+        maxsize (int): Maximum number of cached paths.
+    """
+
+    def __init__(self, ttl: float = 2.0, maxsize: int = 1024) -> None:
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self._entries: OrderedDict[str, tuple[float, bool]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def exists(self, path: str) -> bool:
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(path)
+            if entry is not None and now - entry[0] < self.ttl:
+                return entry[1]
+
+        result = fs.exists(path)
+        with self._lock:
+            self._entries[path] = (now, result)
+            self._entries.move_to_end(path)
+            if len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+        return result
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+PATH_EXISTS_CACHE = PathExistsCache()
+
+
 class NativeFileDialog:
     """
     A wrapper around tkinter.filedialog
@@ -61,8 +160,29 @@ class NativeFileDialog:
         return self.last_dir or self.initial_dir
 
     def open(self):
-        _TKINTER_ROOT.lift()  # Bring the root window to the front
-        _TKINTER_ROOT.attributes("-topmost", True)  # Make the root window always appear on top
+        """Show the dialog and wait for it to close. Blocks the calling thread."""
+        return _TK_THREAD.submit(self._show).result()
+
+    async def open_async(self, timeout: float | None = None):
+        """
+        Show the dialog without blocking the event loop.
+
+        Dialogs are shown one at a time on the Tk thread; concurrent requests are queued.
+        Cancelling the call or running into the timeout drops a queued request.
+        A dialog that is already shown stays open, but its result is discarded.
+
+        Args:
+            timeout (float, optional): Seconds to wait for the dialog to close. Defaults to no timeout.
+
+        Raises:
+            asyncio.TimeoutError: If the dialog was not closed within the timeout.
+        """
+        future = asyncio.wrap_future(_TK_THREAD.submit(self._show))
+        return await asyncio.wait_for(future, timeout)
+
+    def _show(self, root: "tk.Tk"):
+        root.lift()  # Bring the root window to the front
+        root.attributes("-topmost", True)  # Make the root window always appear on top
 
         fn = self._save_dialog_hidden if self.mode == "save" else self._open_dialog_hidden
         filepath = fn()
@@ -72,12 +192,14 @@ class NativeFileDialog:
                 filepath[0] if self.multiple and self.mode == "open" else filepath
             )
             self.chosen = filepath
-        _TKINTER_ROOT.update()  # Make the dialog close completely
+        root.update()  # Make the dialog close completely
 
-        _TKINTER_ROOT.attributes("-topmost", False)  # Reset the topmost attribute
+        root.attributes("-topmost", False)  # Reset the topmost attribute
         return filepath
 
     def _save_dialog_hidden(self):
+        from tkinter import filedialog
+
         options = {
             "initialdir": self._get_dir(),
             "title": self.title_save,
@@ -87,6 +209,8 @@ class NativeFileDialog:
         return filename
 
     def _open_dialog_hidden(self):
+        from tkinter import filedialog
+
         options = {
             "initialdir": self._get_dir(),
             "title": self.title_open,
@@ -123,9 +247,15 @@ class NativeFilePickerElement(Element):
         add_file_exists_indicator: bool = True,
         width_class="w-80",
         on_change_events: list[T.Callable] | None = None,
+        debounce: float = 0.3,
     ) -> None:
+        """
+        Args:
+            debounce (float, optional): Seconds the input has to stay unchanged before the path is validated
+                and `on_change_events` are called.
+        """
         super().__init__()
-        self.file_dialog = NativeFileDialog(
+        self.file_dialog = self.create_file_dialog(
             select=select,
             multiple=False,
             title_open=title,
@@ -134,6 +264,8 @@ class NativeFilePickerElement(Element):
             open_at_last_dir=open_at_last_dir,
         )
         self.on_change_events = on_change_events or []
+        self.debounce = debounce
+        self._change_generation = 0
         self._add_file_exists_indicator = add_file_exists_indicator
         self.auto_complete = []
         self.filepath: str | None = None
@@ -153,8 +285,16 @@ class NativeFilePickerElement(Element):
                 icon=icons.FOLDER_OPEN, on_click=self.open_dialog
             )
 
-    def open_dialog(self):
-        filename = self.file_dialog.open()
+    def create_file_dialog(self, **kwargs) -> NativeFileDialog:
+        """Override this method to use a different file dialog"""
+        return NativeFileDialog(**kwargs)
+
+    def path_exists(self, path: str) -> bool:
+        """Check whether a typed path exists. Runs in a worker thread."""
+        return PATH_EXISTS_CACHE.exists(path)
+
+    async def open_dialog(self):
+        filename = await self.file_dialog.open_async()
         if filename:
             self.filepath = filename
             self.path_input.value = filename
@@ -164,21 +304,37 @@ class NativeFilePickerElement(Element):
 
     def on_path_change(self):
         value = self.path_input.value
+        self._show_path_status(value, self.path_exists(value) if value else False)
+
+    def _show_path_status(self, value: str | None, exists: bool) -> None:
         if not value:
             if self._add_file_exists_indicator:
                 self.label_file_exists.text = "  "
             return
-        if fs.exists(value):
+        if exists:
             if self._add_file_exists_indicator:
                 self.label_file_exists.text = "🟢"
-            self.auto_complete.append(value)
-            self.path_input.set_autocomplete(self.auto_complete)
+            if value not in self.auto_complete:
+                self.auto_complete.append(value)
+                self.path_input.set_autocomplete(self.auto_complete)
         else:
             if self._add_file_exists_indicator:
                 self.label_file_exists.text = "🔴"
 
-    def _on_change(self):
-        self.on_path_change()
+    async def _on_change(self):
+        self._change_generation += 1
+        generation = self._change_generation
+        if self.debounce > 0:
+            await asyncio.sleep(self.debounce)
+            if generation != self._change_generation:
+                return
+
+        value = self.path_input.value
+        exists = await run.io_bound(self.path_exists, value) if value else False
+        if generation != self._change_generation:  # a newer change is being validated
+            return
+
+        self._show_path_status(value, bool(exists))
         for event in self.on_change_events:
             event()
 
@@ -1,15 +1,19 @@
 import datetime
+import itertools
 import os
 import typing as T
+import weakref
 from dataclasses import dataclass
 from functools import partial
 
-from nicegui import ui
+from nicegui import Client, context, run, ui
 from nicegui.element import Element
-from stdl import fs
+from nicegui.events import GenericEventArguments
 
 from nicegui_ext import icons, md
-from nicegui_ext.helpers import is_date_valid
+from nicegui_ext.file_pager import FilePager, read_text
+from nicegui_ext.helpers import batch_updates, is_date_valid
+from nicegui_ext.metrics import METRICS
 from nicegui_ext.native_file_picker import NativeFileDialog
 
 # For multi-line notifications
@@ -113,13 +117,26 @@ class DatePicker(Element):
         value: datetime.date | str | None = None,
         placeholder: str | None = "YYYY//MM//DD",
         tag: str | None = None,
+        lazy: bool = False,
     ):
+        """
+        Args:
+            label (str, optional): Label of the text input.
+            value (datetime.date | str, optional): Initial date.
+            placeholder (str, optional): Placeholder of the text input.
+            tag (str, optional): HTML tag of the element.
+            lazy (bool, optional): Create the calendar menu when it is first opened instead of upfront.
+                `menu_element` and `date_element` are None until then, so open the calendar with `open_menu()`.
+                Forms built by `nicegui_ext.auto` use this mode.
+        """
         super().__init__(tag=tag)
         if isinstance(value, datetime.date):
             value = value.strftime("%Y-%m-%d")
 
         validation = {"Invalid date!": is_date_valid}
 
+        self.menu_element: ui.menu | None = None
+        self.date_element: ui.date | None = None
         with ui.input(
             label,
             value=value or "",
@@ -127,11 +144,43 @@ class DatePicker(Element):
             placeholder=placeholder,
         ) as self.text_input_element:
             with self.text_input_element.add_slot("append"):
-                ui.icon("edit_calendar").on("click", lambda: self.menu_element.open()).classes(
-                    "cursor-pointer"
-                )
-            with ui.menu() as self.menu_element:
-                self.date_element = ui.date(value=value).bind_value(self.text_input_element)
+                ui.icon("edit_calendar").on("click", self.open_menu).classes("cursor-pointer")
+        self.text_input_element.on_value_change(self._on_input_change)
+        if not lazy:
+            self._build_menu()
+
+    @property
+    def value(self) -> str:
+        return self.text_input_element.value
+
+    @value.setter
+    def value(self, value: datetime.date | str | None) -> None:
+        if isinstance(value, datetime.date):
+            value = value.strftime("%Y-%m-%d")
+        self.text_input_element.value = value or ""
+
+    def on_value_change(self, callback: T.Callable) -> "DatePicker":
+        self.text_input_element.on_value_change(callback)
+        return self
+
+    def _build_menu(self) -> None:
+        with self.text_input_element, ui.menu() as self.menu_element:
+            self.date_element = ui.date(
+                value=self.text_input_element.value or None, on_change=self._on_date_change
+            )
+
+    def open_menu(self) -> None:
+        if self.menu_element is None:
+            self._build_menu()
+        self.menu_element.open()  # type: ignore
+
+    def _on_input_change(self, e) -> None:
+        if self.date_element is not None and self.date_element.value != e.value:
+            self.date_element.value = e.value
+
+    def _on_date_change(self, e) -> None:
+        if self.text_input_element.value != e.value:
+            self.text_input_element.value = e.value
 
 
 DialogPosition = T.Literal["standard", "top", "bottom", "left", "right"]
@@ -168,6 +217,55 @@ class Dialog(ui.dialog):
             self.props("seamless")
 
 
+DialogT = T.TypeVar("DialogT", bound=Dialog)
+
+
+class DialogPool:
+    """
+    Keeps one dialog per client and key, so dialogs that are opened repeatedly are only built once.
+    The dialogs keep their structure and only replace their contents on each use.
+    A pooled dialog is forgotten when it is deleted or its client is garbage collected.
+    """
+
+    def __init__(self) -> None:
+        self._dialogs: weakref.WeakKeyDictionary[
+            Client, dict[str, Dialog]
+        ] = weakref.WeakKeyDictionary()
+
+    def __len__(self) -> int:
+        return sum(len(i) for i in self._dialogs.values())
+
+    def get(self, key: str, build: T.Callable[[], DialogT]) -> DialogT:
+        """
+        Get the dialog for a key in the current client.
+
+        Args:
+            key (str): The pool key.
+            build (Callable): Builds the dialog the first time the key is used in a client.
+                It is called inside the client layout, so the dialog is not tied to the element that opened it.
+        """
+        client = context.client
+        dialogs = self._dialogs.setdefault(client, {})
+        dialog = dialogs.get(key)
+        if dialog is None or dialog.is_deleted:
+            with client.layout:
+                dialog = dialogs[key] = build()
+        return dialog  # type: ignore
+
+
+DIALOG_POOL = DialogPool()
+
+
+def _set_heading(heading: ui.markdown, title: str | None, level: int = 4) -> None:
+    """Show a title in a heading that is kept between uses of a dialog, or hide it."""
+    if title:
+        heading.set_content(f"{'#' * level} {title}")
+    heading.set_visibility(bool(title))
+
+
+OversizePolicy = T.Literal["truncate", "page", "reject"]
+
+
 class TextareaDialog(Element):
     def __init__(
         self,
@@ -176,23 +274,45 @@ class TextareaDialog(Element):
         cols: int | None = None,
         placeholder: str | None = None,
         autogrow: bool = True,
+        max_import_bytes: int | None = 1024 * 1024,
+        oversize_policy: OversizePolicy = "truncate",
     ) -> None:
+        """
+        Args:
+            title (str, optional): The dialog title.
+            rows (int, optional): Number of textarea rows.
+            cols (int, optional): Number of textarea columns.
+            placeholder (str, optional): Textarea placeholder.
+            autogrow (bool, optional): Whether the textarea grows with its content.
+            max_import_bytes (int, optional): Size limit for files imported with "From file". None means no limit.
+            oversize_policy (str, optional): What to do with files over the limit.
+                "truncate" imports the first `max_import_bytes` bytes,
+                "page" shows the file in memory-mapped pages of `max_import_bytes` bytes,
+                "reject" refuses to import the file.
+        """
         self.data: str | None = None
         self.rows = rows
         self.cols = cols
         self.title = title
         self.placeholder = placeholder
         self.autogrow = autogrow
+        self.max_import_bytes = max_import_bytes
+        self.oversize_policy = oversize_policy
+        self.dialog: Dialog | None = None
+        self._file_dialog = NativeFileDialog()
+        self._pager: FilePager | None = None
+        self._page_index = 0
         super().__init__()
 
-    async def open(self):
-        file_dialog = NativeFileDialog()
-        with Dialog(maximized=True).classes("w-screen") as dialog, ui.card().classes("w-screen"):
+    def _build_dialog(self) -> None:
+        with self, Dialog(maximized=True).classes("w-screen") as self.dialog, ui.card().classes(
+            "w-screen"
+        ):
             if self.title:
                 with ui.row().classes("items-center"):
                     md.heading(self.title, level=3)
 
-            textarea = Textarea(
+            self.textarea = Textarea(
                 rows=self.rows,
                 cols=self.cols,
                 placeholder=self.placeholder,
@@ -200,26 +320,74 @@ class TextareaDialog(Element):
                 autogrow=self.autogrow,
             ).classes("w-full")
 
-            def submit():
-                dialog.submit(textarea.value)
-                self.data = textarea.value
-
-            def import_file():
-                path = file_dialog.open()
-                if not path:
-                    notification("No file selected", type="warning")
-                    return
-                if os.path.isfile(path):
-                    textarea.value = fs.File(path).read()
-                else:
-                    notification(f"Invalid file '{path}'", type="warning")
+            with ui.row().classes("items-center") as self.pages_row:
+                ui.button(
+                    icon="navigate_before", on_click=lambda: self.show_page(self._page_index - 1)
+                )
+                self.page_label = ui.label()
+                ui.button(
+                    icon="navigate_next", on_click=lambda: self.show_page(self._page_index + 1)
+                )
+            self.pages_row.set_visibility(False)
 
             with ui.row().classes("items-start"):
-                ui.button("Done", icon="done", on_click=submit)
-                ui.button("From file", icon=icons.UPLOAD_FILE, on_click=import_file)
-                ui.button(icon=icons.CLOSE, on_click=dialog.close)
+                ui.button("Done", icon="done", on_click=self.submit)
+                ui.button("From file", icon=icons.UPLOAD_FILE, on_click=self.import_file)
+                ui.button(icon=icons.CLOSE, on_click=self.dialog.close)
+
+    def submit(self) -> None:
+        self.data = self.textarea.value
+        self.dialog.submit(self.textarea.value)
+
+    def close_pager(self) -> None:
+        if self._pager is not None:
+            self._pager.close()
+            self._pager = None
+        self.pages_row.set_visibility(False)
+
+    async def show_page(self, index: int) -> None:
+        pager = self._pager
+        if pager is None or not await run.io_bound(pager.has_page, index):
+            return
+        self._page_index = index
+        self.textarea.value = await run.io_bound(pager.read_page, index)
+        self.page_label.text = f"Page {index + 1}/~{len(pager)}"
+
+    async def import_file(self) -> None:
+        path = await self._file_dialog.open_async()
+        if not path:
+            notification("No file selected", type="warning")
+            return
+        if not os.path.isfile(path):
+            notification(f"Invalid file '{path}'", type="warning")
+            return
+
+        self.close_pager()
+        limit = self.max_import_bytes
+        if limit is None or os.path.getsize(path) <= limit:
+            self.textarea.value, _ = await run.io_bound(read_text, path)
+        elif self.oversize_policy == "reject":
+            notification(f"File '{path}' is larger than {limit} bytes", type="warning")
+        elif self.oversize_policy == "page":
+            self._pager = FilePager(path, page_size=limit)
+            self.pages_row.set_visibility(True)
+            await self.show_page(0)
+        else:
+            self.textarea.value, _ = await run.io_bound(read_text, path, limit)
+            notification(f"Imported the first {limit} bytes of '{path}'", type="info")
 
-        selected = await dialog
+    async def open(self):
+        """Open the dialog. It is built on the first call and reused afterwards."""
+        if self.dialog is None or self.dialog.is_deleted:
+            with METRICS.measure("TextareaDialog.open"):
+                self._build_dialog()
+        else:
+            self.textarea.value = ""
+
+        try:
+            selected = await self.dialog  # type: ignore
+        finally:
+            self.close_pager()
         self.data = selected
 
 
@@ -230,40 +398,99 @@ class SelectOption:
     tooltip: str | None = None
 
 
+class _SelectionDialog(Dialog):
+    """Dialog of `selection_dialog`. Its card and heading are kept, only the option buttons are replaced."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        with self:
+            with ui.card().classes("items-center") as self.card:
+                self.heading = md.heading("", level=4)
+                self.options = ui.row().classes("items-center")
+
+    def show_options(
+        self, options: list[SelectOption], title: str | None, one_per_row: bool, width_class: str
+    ) -> None:
+        self.classes(replace=f"items-center {width_class}")
+        self.card.classes(replace=f"items-center {width_class}")
+        _set_heading(self.heading, title)
+        self.options.clear()
+        with self.options:
+            for opt in options:
+                if one_per_row:
+                    with ui.column().classes("items-center"):
+                        self._add_button(opt)
+                else:
+                    self._add_button(opt)
+
+    def _add_button(self, opt: SelectOption) -> None:
+        button = ui.button(opt.name, on_click=partial(self.submit, opt.value))
+        if opt.tooltip:
+            with button:
+                tooltip(opt.tooltip)
+
+
 async def selection_dialog(
     options: list[SelectOption],
     title: str | None = None,
     one_per_row: bool = False,
     width_class="w-screen",
+    pooled: bool = False,
 ):
+    """
+    Args:
+        pooled (bool, optional): Reuse one dialog per client and only replace its option buttons.
+            Otherwise the dialog is deleted when it is closed.
+    """
     if not options:
         raise ValueError("Selection data must not be empty")
 
-    with ui.dialog().classes("items-center").classes(width_class) as dialog, ui.card().classes(
-        "items-center"
-    ).classes(width_class):
-        if title:
-            md.heading(title, level=4)
+    with METRICS.measure("selection_dialog"):
+        if pooled:
+            dialog = DIALOG_POOL.get("selection_dialog", _SelectionDialog)
+        else:
+            dialog = _SelectionDialog()
+        dialog.show_options(options, title, one_per_row, width_class)
 
-        def submit(value):
-            dialog.submit(value)
+    try:
+        selected = await dialog
+    finally:
+        if not pooled:
+            dialog.delete()
+    return selected
 
-        def make_button():
-            button = ui.button(opt.name, on_click=partial(submit, value=opt.value))
-            if opt.tooltip:
-                with button:
-                    tooltip(opt.tooltip)
 
-        with ui.row().classes("items-center"):
-            for opt in options:
-                if one_per_row:
-                    with ui.column().classes("items-center"):
-                        make_button()
-                else:
-                    make_button()
+class _ListDialog(Dialog):
+    """Dialog of `list_display_dialog`. Its card and heading are kept, only the item rows are replaced."""
 
-    selected = await dialog
-    return selected
+    def __init__(self) -> None:
+        super().__init__()
+        self.delete_on_close = False
+        with self:
+            with ui.card() as self.card:
+                self.heading = md.heading("", level=4)
+                self.rows = ui.column().classes("w-full")
+        self.on_value_change(self._on_value_change)
+
+    def show_items(
+        self,
+        items: T.Iterable[T.Any],
+        item_display_fn: T.Callable,
+        title: str | None,
+        width_class: str,
+    ) -> None:
+        self.classes(replace=width_class)
+        self.card.classes(replace=width_class)
+        _set_heading(self.heading, title)
+        self.rows.clear()
+        with self.rows:
+            for item in items:
+                with ui.row().classes("items-center"):
+                    item_display_fn(item)
+
+    def _on_value_change(self, e) -> None:
+        if not e.value and self.delete_on_close:
+            self.delete()
 
 
 def list_display_dialog(
@@ -271,15 +498,344 @@ def list_display_dialog(
     item_display_fn: T.Callable | None = None,
     title: str | None = None,
     width_class="w-screen",
+    pooled: bool = False,
+    delete_on_close: bool = False,
 ):
+    """
+    Args:
+        pooled (bool, optional): Reuse one dialog per client and only replace its item rows on each call.
+        delete_on_close (bool, optional): Delete the dialog when it is closed.
+            Otherwise the returned dialog can be opened again. Can't be used with `pooled`.
+    """
+    if pooled and delete_on_close:
+        raise ValueError("A pooled dialog can't be deleted on close")
     if not item_display_fn:
         item_display_fn = lambda item: ui.markdown(f"- {item}")
 
-    with ui.dialog().classes(width_class) as dialog, ui.card().classes(width_class):
-        if title:
-            md.heading(title, level=4)
-        for item in items:
-            with ui.row().classes("items-center"):
-                item_display_fn(item)
+    with METRICS.measure("list_display_dialog"):
+        if pooled:
+            dialog = DIALOG_POOL.get("list_display_dialog", _ListDialog)
+        else:
+            dialog = _ListDialog()
+            dialog.delete_on_close = delete_on_close
+        dialog.show_items(items, item_display_fn, title, width_class)
+    return dialog
+
+
+class _ItemPager:
+    """Takes items in pages from an iterable or an async iterable."""
+
+    def __init__(self, items: T.Iterable[T.Any] | T.AsyncIterable[T.Any]) -> None:
+        self._iterator: T.Iterator[T.Any] | None = None
+        self._async_iterator: T.AsyncIterator[T.Any] | None = None
+        if isinstance(items, T.AsyncIterable):
+            self._async_iterator = aiter(items)
+        else:
+            self._iterator = iter(items)
+        self.exhausted = False
+
+    async def next_page(self, size: int) -> list[T.Any]:
+        if self._iterator is not None:
+            page = list(itertools.islice(self._iterator, size))
+        else:
+            page = []
+            for _ in range(size):
+                try:
+                    page.append(await anext(self._async_iterator))  # type: ignore
+                except StopAsyncIteration:
+                    break
+        if len(page) < size:
+            self.exhausted = True
+        return page
+
+
+class VirtualColumn(ui.scroll_area):
+    """
+    Scrollable column that only builds the rows of the pages in or near the viewport.
+
+    Items are split into pages of `page_size`. The page in view and `window` pages on each side of it are built.
+    All other pages are deleted and replaced by spacers of `item_height` pixels per item,
+    so the number of elements stays the same however far the list is scrolled.
+
+    Args:
+        build_row (Callable): Builds the elements of a single item. Called inside the row.
+        items (list, optional): Initial items. The list is used as it is, so later changes to it are seen by `refresh()`.
+        load_more (Callable, optional): Async function that takes a number of items and returns up to that many new items.
+            Called when the end of the list is scrolled into view. A short page ends loading.
+        page_size (int, optional): Number of items in a page.
+        item_height (int, optional): Minimal height of a row in pixels. Used to size the spacers and to find the page in view.
+        window (int, optional): Number of pages built on each side of the page in view.
+        load_threshold (float, optional): Scroll position (0-1) at which more items are loaded.
+        lazy (bool, optional): Don't build the first pages until `ensure_rendered()` is called.
+    """
+
+    def __init__(
+        self,
+        build_row: T.Callable[[T.Any], T.Any],
+        items: list[T.Any] | None = None,
+        load_more: T.Callable[[int], T.Awaitable[list[T.Any]]] | None = None,
+        page_size: int = 50,
+        item_height: int = 36,
+        window: int = 1,
+        load_threshold: float = 0.9,
+        lazy: bool = False,
+    ) -> None:
+        super().__init__()
+        self.build_row = build_row
+        self.items: list[T.Any] = items if items is not None else []
+        self.load_more = load_more
+        self.page_size = page_size
+        self.item_height = item_height
+        self.window = window
+        self.load_threshold = load_threshold
+        self.exhausted = load_more is None
+        self.current_page = 0
+        self.pages: dict[int, ui.column] = {}
+        self._spacer_heights = (0, 0)
+        self._loading = False
+
+        with self:
+            self.top_spacer = ui.element("div")
+            self.pages_column = ui.column().classes("w-full gap-1")
+            self.bottom_spacer = ui.element("div")
+            self.more_button = ui.button("Load more", on_click=self.load_next).props("flat")
+        self.more_button.set_visibility(not self.exhausted)
+        self.on(
+            "scroll",
+            self._on_scroll,
+            args=["verticalPosition", "verticalPercentage", "verticalSize"],
+            throttle=0.1,
+        )
+        if not lazy:
+            self.show_page(0)
+
+    def reset(
+        self,
+        items: list[T.Any] | None = None,
+        load_more: T.Callable[[int], T.Awaitable[list[T.Any]]] | None = None,
+    ) -> None:
+        """
+        Replace the items and delete all built pages. The first pages are built by `ensure_rendered()`.
+
+        Args:
+            items (list, optional): The new items.
+            load_more (Callable, optional): The new function that loads more items.
+        """
+        scrolled = bool(self.items)
+        for page in self.pages.values():
+            page.delete()
+        self.pages.clear()
+        self.items = items if items is not None else []
+        self.load_more = load_more
+        self.exhausted = load_more is None
+        self.current_page = 0
+        self.more_button.set_visibility(not self.exhausted)
+        self._loading = False
+        self._update_spacers(range(0))
+        if scrolled:
+            self.scroll_to(pixels=0)
+
+    @property
+    def n_pages(self) -> int:
+        return max(1, -(-len(self.items) // self.page_size))
+
+    def ensure_rendered(self) -> None:
+        """Build the pages in view if nothing was built yet."""
+        if not self.pages:
+            self.show_page(self.current_page)
+
+    def show_page(self, index: int) -> None:
+        """Build the pages around a page and delete all others."""
+        index = min(max(index, 0), self.n_pages - 1)
+        self.current_page = index
+        wanted = range(max(0, index - self.window), min(self.n_pages, index + self.window + 1))
+        for i in [i for i in self.pages if i not in wanted]:
+            self.pages.pop(i).delete()
+        for i in wanted:
+            if i not in self.pages:
+                self._build_page(i)
+        self._update_spacers(wanted)
+
+    def refresh(self, start: int = 0) -> None:
+        """
+        Rebuild the built pages after the items changed.
 
+        Args:
+            start (int, optional): Index of the first changed item. Pages before it are kept.
+        """
+        for i in [i for i in self.pages if i >= start // self.page_size]:
+            self.pages.pop(i).delete()
+        self.show_page(self.current_page)
+
+    def _build_page(self, index: int) -> None:
+        position = sum(1 for i in self.pages if i < index)
+        start = index * self.page_size
+        with batch_updates(self.pages_column), self.pages_column:
+            with ui.column().classes("w-full gap-1") as page:
+                for item in self.items[start : start + self.page_size]:
+                    with ui.row().classes("items-center no-wrap").style(
+                        f"min-height: {self.item_height}px"
+                    ):
+                        self.build_row(item)
+            if position < len(self.pages):
+                page.move(target_index=position)
+        self.pages[index] = page
+
+    def _update_spacers(self, built: range) -> None:
+        self._spacer_heights = (
+            built.start * self.page_size * self.item_height,
+            max(0, len(self.items) - built.stop * self.page_size) * self.item_height,
+        )
+        self.top_spacer.style(f"height: {self._spacer_heights[0]}px")
+        self.bottom_spacer.style(f"height: {self._spacer_heights[1]}px")
+
+    def page_at(self, position: float, size: float) -> int:
+        """
+        Get the index of the page at a scroll position.
+
+        Args:
+            position (float): Scroll position in pixels.
+            size (float): Height of the scrolled content in pixels.
+        """
+        page_height = self.page_size * self.item_height
+        top, bottom = self._spacer_heights
+        if position < top or not self.pages:
+            return int(position // page_height)
+        first = min(self.pages)
+        n_built = len(self.pages)
+        built_height = max(
+            size - top - bottom, 1
+        )  # actual height, rows can be taller than item_height
+        if position < top + built_height:
+            return first + int((position - top) / built_height * n_built)
+        return first + n_built + int((position - top - built_height) // page_height)
+
+    async def load_next(self) -> None:
+        """Take the next page of items from `load_more`."""
+        if self.exhausted or self._loading:
+            return
+        load_more = self.load_more
+        self._loading = True
+        try:
+            new_items = await load_more(self.page_size)  # type: ignore
+        finally:
+            if self.load_more is load_more:
+                self._loading = False
+        if self.load_more is not load_more:  # reset while loading
+            return
+        if len(new_items) < self.page_size:
+            self.exhausted = True
+            self.more_button.set_visibility(False)
+        if new_items:
+            self.items.extend(new_items)
+            self.refresh(len(self.items) - len(new_items))
+
+    async def _on_scroll(self, e: GenericEventArguments) -> None:
+        self.show_page(self.page_at(e.args["verticalPosition"], e.args["verticalSize"]))
+        if e.args["verticalPercentage"] >= self.load_threshold:
+            await self.load_next()
+
+
+class _VirtualListDialog(Dialog):
+    """Dialog of `virtual_list_display_dialog`. Its card, heading and `VirtualColumn` are kept between uses."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.delete_on_close = False
+        with self:
+            with ui.card() as self.card:
+                self.heading = md.heading("", level=4)
+                self.rows = VirtualColumn(lambda item: None, lazy=True)
+        self.on_value_change(self._on_value_change)
+
+    def show_items(
+        self,
+        pager: _ItemPager,
+        item_display_fn: T.Callable,
+        title: str | None,
+        width_class: str,
+        height_class: str,
+        page_size: int,
+        item_height: int,
+        window: int,
+        load_threshold: float,
+    ) -> None:
+        self.classes(replace=width_class)
+        self.card.classes(replace=width_class)
+        _set_heading(self.heading, title)
+        rows = self.rows
+        rows.classes(replace=f"{height_class} w-full")
+        rows.build_row = item_display_fn
+        rows.page_size = page_size
+        rows.item_height = item_height
+        rows.window = window
+        rows.load_threshold = load_threshold
+        rows.reset(load_more=pager.next_page)
+
+    async def _on_value_change(self, e) -> None:
+        if not e.value:
+            if self.delete_on_close:
+                self.delete()
+        elif not self.rows.items:
+            await self.rows.load_next()
+
+
+def virtual_list_display_dialog(
+    items: T.Iterable[T.Any] | T.AsyncIterable[T.Any],
+    item_display_fn: T.Callable | None = None,
+    title: str | None = None,
+    width_class="w-screen",
+    height_class="h-[70vh]",
+    page_size: int = 50,
+    item_height: int = 36,
+    window: int = 1,
+    load_threshold: float = 0.9,
+    pooled: bool = False,
+    delete_on_close: bool = False,
+):
+    """
+    A variant of `list_display_dialog` for large or streamed collections.
+
+    Items are taken from the iterable a page at a time: the first page when the dialog is opened,
+    and the next one whenever the list is scrolled close to its end.
+    Only the rows of the pages in or near the viewport are built. See `VirtualColumn`.
+
+    Args:
+        items (Iterable | AsyncIterable): The items to display. Can be a generator or an async generator.
+        item_display_fn (Callable, optional): Builds the elements for a single item. Defaults to a markdown list item.
+        title (str, optional): The dialog title.
+        width_class (str, optional): Tailwind width class of the dialog.
+        height_class (str, optional): Tailwind height class of the scrollable list.
+        page_size (int, optional): Number of items in a page.
+        item_height (int, optional): Minimal height of a row in pixels.
+        window (int, optional): Number of pages built on each side of the page in view.
+        load_threshold (float, optional): Scroll position (0-1) at which the next page is loaded.
+        pooled (bool, optional): Reuse one dialog per client and only replace its items on each call.
+        delete_on_close (bool, optional): Delete the dialog when it is closed.
+            Otherwise the returned dialog can be opened again. Can't be used with `pooled`.
+    """
+    if pooled and delete_on_close:
+        raise ValueError("A pooled dialog can't be deleted on close")
+    if not item_display_fn:
+        item_display_fn = lambda item: ui.markdown(f"- {item}")
+
+    pager = _ItemPager(items)
+
+    with METRICS.measure("virtual_list_display_dialog"):
+        if pooled:
+            dialog = DIALOG_POOL.get("virtual_list_display_dialog", _VirtualListDialog)
+        else:
+            dialog = _VirtualListDialog()
+            dialog.delete_on_close = delete_on_close
+        dialog.show_items(
+            pager,
+            item_display_fn,
+            title,
+            width_class,
+            height_class,
+            page_size,
+            item_height,
+            window,
+            load_threshold,
+        )
     return dialog
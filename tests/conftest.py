@@ -0,0 +1,53 @@
+import asyncio
+import typing as T
+
+import pytest
+from nicegui import Client, core
+from nicegui.page import page
+
+
+def new_client() -> Client:
+    client = Client(page("/"), request=None)
+    # NiceGUI enters the auto-index client on import, so the new layout was added to its content
+    if client.layout.parent_slot is not None:
+        client.layout.parent_slot.children.remove(client.layout)
+        client.layout.parent_slot = None
+    return client
+
+
+def close_client(client: Client) -> None:
+    """Delete a client the way the server does after a disconnect."""
+    client.delete()
+    # The app never starts in tests, so the outbox loop is still waiting to be started
+    if client.outbox.loop in core.app._startup_handlers:
+        core.app._startup_handlers.remove(client.outbox.loop)
+
+
+@pytest.fixture
+def client() -> T.Iterator[Client]:
+    """A client without a browser connection. Elements created in the test belong to it."""
+    client = new_client()
+    with client:
+        yield client
+    close_client(client)
+
+
+@pytest.fixture
+def run(client: Client) -> T.Callable[[T.Awaitable], T.Any]:
+    """
+    Run a coroutine in the client on a new event loop.
+    NiceGUI uses the loop for background tasks and event handlers.
+    """
+
+    def run(coro: T.Awaitable) -> T.Any:
+        async def main():
+            core.loop = asyncio.get_running_loop()
+            with client:
+                return await coro
+
+        try:
+            return asyncio.run(main())
+        finally:
+            core.loop = None
+
+    return run
@@ -0,0 +1,155 @@
+"""
+Benchmarks of element construction and interaction.
+
+The normal test run calls each benchmarked function only once (see `addopts` in pyproject.toml).
+To measure and store the results as JSON:
+
+    pytest tests/test_benchmarks.py --benchmark-enable --benchmark-json=benchmark.json
+
+Use `--benchmark-autosave` and `--benchmark-compare` to compare runs.
+The peak memory of one call is stored in the `extra_info` of each benchmark.
+"""
+
+import asyncio
+import tracemalloc
+import typing as T
+from dataclasses import field, make_dataclass
+
+import pytest
+from nicegui import core, ui
+from pydantic import create_model
+
+from nicegui_ext import Draggable, Row
+from nicegui_ext.auto.class_element import ClassElement
+from nicegui_ext.auto.pydantic_element import PydanticModelElement
+from nicegui_ext.draggable import DRAG_STATE
+from nicegui_ext.ui import SelectOption, list_display_dialog, selection_dialog
+
+N_FIELDS = [5, 50, 500]
+N_CARDS = 1_000
+N_ITEMS = 1_000
+
+
+def record_peak_memory(benchmark, fn: T.Callable, *args) -> None:
+    """Call `fn` once with tracemalloc enabled and store its peak allocation in the benchmark results."""
+    tracemalloc.start()
+    try:
+        fn(*args)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    benchmark.extra_info["peak_memory_bytes"] = peak
+
+
+def clear_content(client) -> T.Callable[[], None]:
+    def clear() -> None:
+        client.content.clear()
+
+    return clear
+
+
+def make_class(n: int) -> type:
+    fields = [(f"field_{i}", int, field(default=i)) for i in range(n)]
+    return make_dataclass(f"Class{n}", fields)
+
+
+def make_model(n: int) -> type:
+    return create_model(f"Model{n}", **{f"field_{i}": (int, i) for i in range(n)})  # type: ignore
+
+
+@pytest.mark.parametrize("n", N_FIELDS)
+def test_class_element_construction(benchmark, client, n):
+    cls = make_class(n)
+    record_peak_memory(benchmark, ClassElement, cls)
+    benchmark.pedantic(ClassElement, (cls,), setup=clear_content(client), rounds=5)
+
+
+@pytest.mark.parametrize("n", N_FIELDS)
+def test_pydantic_model_element_construction(benchmark, client, n):
+    model = make_model(n)
+    record_peak_memory(benchmark, PydanticModelElement, model)
+    benchmark.pedantic(PydanticModelElement, (model,), setup=clear_content(client), rounds=5)
+
+
+@pytest.mark.parametrize("n", N_FIELDS)
+def test_get_args(benchmark, client, n):
+    form = ClassElement(make_class(n))
+
+    def get_args():
+        form.parsed_values.clear()  # coerce every field, not only the changed ones
+        return form.get_args()
+
+    record_peak_memory(benchmark, get_args)
+    args = benchmark(get_args)
+    assert len(args) == n
+
+
+def test_row_shuffle(benchmark, client):
+    with Row() as row:
+        for _ in range(N_CARDS):
+            Draggable()
+    record_peak_memory(benchmark, row.shuffle)
+    benchmark(row.shuffle)
+    assert len(row.get_draggable_children()) == N_CARDS
+
+
+def test_draggable_on_drop(benchmark, client):
+    with Row() as row:
+        cards = [Draggable() for _ in range(N_CARDS)]
+
+    def drop():
+        DRAG_STATE.set(client, cards[0])
+        cards[-1].on_drop()
+
+    record_peak_memory(benchmark, drop)
+    benchmark(drop)
+    assert len(row.get_draggable_children()) == N_CARDS
+
+
+def show_item(item) -> None:
+    ui.label(str(item))
+
+
+@pytest.mark.parametrize("pooled", [False, True])
+def test_list_display_dialog(benchmark, client, pooled):
+    items = list(range(N_ITEMS))
+
+    def open_dialog():
+        dialog = list_display_dialog(items, show_item, pooled=pooled, delete_on_close=not pooled)
+        dialog.open()
+        dialog.close()
+
+    record_peak_memory(benchmark, open_dialog)
+    benchmark(open_dialog)
+
+
+@pytest.fixture
+def event_loop(client) -> T.Iterator[asyncio.AbstractEventLoop]:
+    """An event loop that is reused between rounds, as pooled dialogs are bound to the loop they were opened in."""
+    loop = asyncio.new_event_loop()
+    core.loop = loop
+    yield loop
+    core.loop = None
+    loop.close()
+
+
+@pytest.mark.parametrize("pooled", [False, True])
+def test_selection_dialog(benchmark, client, event_loop, pooled):
+    options = [SelectOption(f"option {i}", str(i)) for i in range(N_ITEMS)]
+
+    async def select():
+        with client:
+            return await selection_dialog(options, pooled=pooled)
+
+    async def open_dialog():
+        task = asyncio.create_task(select())
+        await asyncio.sleep(0)
+        dialog = next(i for i in client.elements.values() if isinstance(i, ui.dialog) and i.value)
+        dialog.submit("0")
+        return await task
+
+    def run():
+        return event_loop.run_until_complete(open_dialog())
+
+    record_peak_memory(benchmark, run)
+    assert benchmark(run) == "0"
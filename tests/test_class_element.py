@@ -0,0 +1,182 @@
+import asyncio
+import pickle
+import threading
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass
+
+import pytest
+from nicegui import ui
+from pydantic import BaseModel, Field
+
+from nicegui_ext.auto import class_element
+from nicegui_ext.auto.class_element import ClassElement, FieldValidationError
+from nicegui_ext.auto.pydantic_element import PydanticModelElement
+
+
+@dataclass
+class Point:
+    x: int = 1
+    y: int = 2
+    name: str = "p"
+
+
+def test_cached_parse_is_reused_until_the_field_is_edited(client):
+    form = ClassElement(Point)
+    assert form.get_args() == {"x": 1, "y": 2, "name": "p"}
+    assert not form.dirty_fields
+
+    form.parsed_values["y"] = "cached"
+    assert form.get_args()["y"] == "cached"
+
+    form.field_elements["y"].value = "5"
+    assert form.is_dirty("y")
+    assert form.get_args() == {"x": 1, "y": 5, "name": "p"}
+    assert not form.dirty_fields
+
+
+def test_untracked_fields_are_always_parsed(client):
+    form = ClassElement(Point)
+    element = ui.element()
+    element.value = "7"  # type: ignore
+    form.register_field("x", element)
+    assert form.untracked_fields == {"x"}
+    assert form.get_args()["x"] == 7
+
+    element.value = "8"  # type: ignore
+    assert form.get_args()["x"] == 8
+    assert form.get_changed_args() == {"x": 8, "y": 2, "name": "p"}
+    form.take_snapshot()
+    assert form.get_changed_args() == {}
+    element.value = "9"  # type: ignore
+    assert form.get_changed_args() == {"x": 9}
+
+
+def test_pending_values_of_lazy_sections(client):
+    form = ClassElement(Point, expandable=True, lazy=True)
+    assert not form.is_built
+    assert form.get_args() == {"x": 1, "y": 2, "name": "p"}
+
+    form.set_state({"schema": form.plan.schema_hash, "values": {"x": "3"}})
+    assert form.is_dirty("x")
+    assert form.get_args()["x"] == 3
+
+    form.ensure_built()
+    assert form.get_args() == {"x": 3, "y": 2, "name": "p"}
+    form.field_elements["x"].value = "4"
+    assert form.get_args()["x"] == 4
+
+
+def test_reset_to_defaults_invalidates_cached_values(client):
+    form = ClassElement(Point)
+    form.field_elements["x"].value = "10"
+    assert form.get_args()["x"] == 10
+    form.reset_to_defaults()
+    assert form.get_args()["x"] == 1
+
+    lazy = ClassElement(Point, expandable=True, lazy=True)
+    lazy.set_pending_value("x", "10")
+    assert lazy.get_args()["x"] == 10
+    lazy.reset_to_defaults()
+    assert lazy.get_args()["x"] == 1
+
+
+def test_changed_args_since_snapshot(client):
+    form = ClassElement(Point)
+    assert form.get_changed_args() == form.get_args()  # no snapshot yet
+
+    assert form.take_snapshot() == {"x": 1, "y": 2, "name": "p"}
+    assert form.get_changed_args() == {}
+
+    form.field_elements["name"].value = "q"
+    form.field_elements["x"].value = "1"  # edited, but equal to the snapshot
+    assert form.get_changed_args() == {"name": "q"}
+
+    form.take_snapshot()
+    assert form.get_changed_args() == {}
+
+
+class Slow:
+    release = threading.Event()
+
+    def __init__(self, x: int = 1) -> None:
+        Slow.release.wait(5)
+        self.x = x
+        self.thread = threading.current_thread().name
+
+
+class Numbers:
+    def __init__(self, nums: list[int] = [1]) -> None:
+        self.nums = nums
+
+
+class Limits(BaseModel):
+    low: int = Field(0, gt=0)
+    high: int = Field(0, lt=0)
+    name: str = "ok"
+
+
+@pytest.fixture
+def notifications(monkeypatch) -> list[str]:
+    messages = []
+    monkeypatch.setattr(
+        class_element, "notification", lambda message, **kwargs: messages.append(message)
+    )
+    return messages
+
+
+def test_get_instance_async_guards_against_double_submit(client, run, notifications):
+    form = ClassElement(Slow)
+    Slow.release.clear()
+
+    async def main():
+        first = asyncio.create_task(form.get_instance_async())
+        await asyncio.sleep(0.05)
+        assert form.is_submitting
+        assert await form.get_instance_async() is None
+        Slow.release.set()
+        return await first
+
+    instance = run(main())
+    assert instance.x == 1
+    assert notifications == ["Submission already in progress"]
+    assert not form.is_submitting
+
+
+def test_get_instance_async_runs_in_the_given_executor(client, run):
+    form = ClassElement(Slow)
+    Slow.release.set()
+    with ThreadPoolExecutor(thread_name_prefix="forms") as executor:
+        instance = run(form.get_instance_async(executor))
+    assert instance.thread.startswith("forms")
+
+
+def test_get_instance_async_maps_validation_errors(client, run, notifications):
+    form = PydanticModelElement(Limits, validate_on_change=False)
+    with pytest.raises(FieldValidationError) as e:
+        run(form.get_instance_async())
+    assert set(e.value.errors) == {"low", "high"}
+    assert len(notifications) == 2
+    assert notifications[0].startswith("Low: Input should be greater than 0")
+    assert not form.is_submitting
+
+    form.field_elements["low"].value = 1
+    form.field_elements["high"].value = -1
+    assert run(form.get_instance_async()) == Limits(low=1, high=-1)
+
+
+def test_field_validation_error_pickles():
+    error = pickle.loads(pickle.dumps(FieldValidationError({"x": "bad", "": "model"})))
+    assert error.errors == {"x": "bad", "": "model"}
+    assert str(error) == "x: bad; model"
+
+
+def test_get_instance_async_in_a_process_pool(client, run, notifications):
+    form = ClassElement(Numbers)
+    form.field_elements["nums"].value = "1, x"
+    with ProcessPoolExecutor(1) as executor:
+        with pytest.raises(FieldValidationError) as e:
+            run(form.get_instance_async(executor))
+        assert set(e.value.errors) == {"nums"}
+        form.field_elements["nums"].value = "1, 2"
+        assert run(form.get_instance_async(executor)).nums == [1, 2]
+    assert len(notifications) == 1
@@ -0,0 +1,210 @@
+import asyncio
+import gc
+import typing as T
+
+import pytest
+from nicegui import ui
+
+from nicegui_ext.ui import (
+    SelectOption,
+    TextareaDialog,
+    list_display_dialog,
+    selection_dialog,
+    virtual_list_display_dialog,
+)
+
+N_OPENS = 10_000
+N_WARM_UP = 100
+MAX_OBJECT_GROWTH = 1_000
+
+
+def flush(client) -> None:
+    """Drop the queued messages, as the outbox loop does after sending them to the browser."""
+    client.outbox.updates.clear()
+    client.outbox.messages.clear()
+
+
+async def measure_growth(
+    client, open_dialog: T.Callable[[], T.Awaitable], n: int
+) -> tuple[int, int]:
+    """
+    Open and close a dialog `n` times after a warm-up.
+
+    Returns:
+        The growth of the number of elements of the client and of the number of objects tracked by the garbage collector.
+    """
+    for _ in range(N_WARM_UP):
+        await open_dialog()
+        flush(client)
+    gc.collect()
+    n_elements = len(client.elements)
+    n_objects = len(gc.get_objects())
+    for _ in range(n):
+        await open_dialog()
+        flush(client)
+    gc.collect()
+    return len(client.elements) - n_elements, len(gc.get_objects()) - n_objects
+
+
+def show_item(item) -> None:
+    ui.label(str(item))
+
+
+@pytest.mark.parametrize("pooled", [False, True])
+def test_list_display_dialog_memory_growth(client, run, pooled):
+    async def open_dialog():
+        dialog = list_display_dialog(range(3), show_item, pooled=pooled, delete_on_close=not pooled)
+        dialog.open()
+        dialog.close()
+
+    n_elements, n_objects = run(measure_growth(client, open_dialog, N_OPENS))
+    assert n_elements == 0
+    assert n_objects < MAX_OBJECT_GROWTH
+
+
+@pytest.mark.parametrize("pooled", [False, True])
+def test_virtual_list_display_dialog_memory_growth(client, run, pooled):
+    async def open_dialog():
+        dialog = virtual_list_display_dialog(
+            range(100), show_item, page_size=10, pooled=pooled, delete_on_close=not pooled
+        )
+        dialog.open()
+        await asyncio.sleep(0)  # first page is loaded by the value change handler
+        dialog.close()
+
+    n_elements, n_objects = run(measure_growth(client, open_dialog, N_OPENS // 10))
+    assert n_elements == 0
+    assert n_objects < MAX_OBJECT_GROWTH
+
+
+@pytest.mark.parametrize("pooled", [False, True])
+def test_selection_dialog_memory_growth(client, run, pooled):
+    options = [SelectOption("a", "A", "first"), SelectOption("b", "B")]
+
+    async def select():
+        with client:
+            return await selection_dialog(options, title="Select", pooled=pooled)
+
+    async def open_dialog():
+        task = asyncio.create_task(select())
+        await asyncio.sleep(0)
+        dialog = next(i for i in client.elements.values() if isinstance(i, ui.dialog) and i.value)
+        dialog.submit("A")
+        assert await task == "A"
+
+    n_elements, n_objects = run(measure_growth(client, open_dialog, N_OPENS))
+    assert n_elements == 0
+    assert n_objects < MAX_OBJECT_GROWTH
+
+
+def test_textarea_dialog_memory_growth(client, run):
+    textarea_dialog = TextareaDialog()
+
+    async def open_in_client():
+        with client:
+            await textarea_dialog.open()
+
+    async def open_dialog():
+        task = asyncio.create_task(open_in_client())
+        await asyncio.sleep(0)
+        textarea_dialog.textarea.value = "text"
+        textarea_dialog.submit()
+        await task
+
+    n_elements, n_objects = run(measure_growth(client, open_dialog, N_OPENS))
+    assert textarea_dialog.data == "text"
+    assert n_elements == 0
+    assert n_objects < MAX_OBJECT_GROWTH
+
+
+def labels(element) -> list[str]:
+    return [i.text for i in element.descendants() if isinstance(i, ui.label)]
+
+
+def test_pooled_list_display_dialog_keeps_its_structure(client):
+    dialog = list_display_dialog(range(3), show_item, title="First", pooled=True)
+    card, heading, rows = dialog.card, dialog.heading, dialog.rows
+    assert labels(rows) == ["0", "1", "2"]
+
+    assert list_display_dialog(["a"], show_item, pooled=True) is dialog
+    assert (dialog.card, dialog.heading, dialog.rows) == (card, heading, rows)
+    assert labels(rows) == ["a"]
+    assert not heading.visible
+
+    list_display_dialog([], show_item, title="Second", pooled=True)
+    assert heading.visible and heading.content == "#### Second"
+    assert len(dialog._change_handlers) == 1
+
+
+def test_pooled_selection_dialog_keeps_its_structure(client, run):
+    options = [SelectOption("a", "A", "first"), SelectOption("b", "B")]
+
+    async def open_in_client(options, title):
+        with client:
+            return await selection_dialog(options, title=title, pooled=True)
+
+    async def select(options, title=None):
+        task = asyncio.create_task(open_in_client(options, title))
+        await asyncio.sleep(0)
+        dialog = next(i for i in client.elements.values() if isinstance(i, ui.dialog) and i.value)
+        buttons = [i for i in dialog.options.descendants() if isinstance(i, ui.button)]
+        dialog.submit(buttons[-1].text)
+        return dialog, await task
+
+    async def main():
+        dialog, selected = await select(options, "Select")
+        assert selected == "b"
+        card, heading, row = dialog.card, dialog.heading, dialog.options
+        assert await select([SelectOption("c", "C")]) == (dialog, "c")
+        assert (dialog.card, dialog.heading, dialog.options) == (card, heading, row)
+        return dialog
+
+    second = run(main())
+    assert not second.heading.visible
+    assert [i.text for i in second.options.descendants() if isinstance(i, ui.button)] == ["c"]
+
+
+def test_pooled_virtual_list_display_dialog_keeps_its_structure(client, run):
+    async def main():
+        dialog = virtual_list_display_dialog(range(100), show_item, page_size=10, pooled=True)
+        rows = dialog.rows
+        dialog.open()
+        await asyncio.sleep(0)
+        assert rows.items == list(range(10))
+        dialog.close()
+
+        assert virtual_list_display_dialog(["a", "b"], show_item, pooled=True) is dialog
+        assert dialog.rows is rows
+        assert rows.items == [] and not rows.pages
+        dialog.open()
+        await asyncio.sleep(0)
+        assert rows.items == ["a", "b"] and rows.exhausted
+        assert labels(rows) == ["a", "b"]
+
+    run(main())
+
+
+@pytest.mark.parametrize("virtual", [False, True])
+def test_list_display_dialog_can_be_reopened(client, run, virtual):
+    async def main():
+        if virtual:
+            dialog = virtual_list_display_dialog(range(3), show_item)
+        else:
+            dialog = list_display_dialog(range(3), show_item)
+        for _ in range(2):
+            dialog.open()
+            await asyncio.sleep(0)
+            dialog.close()
+        assert not dialog.is_deleted
+        assert labels(dialog) == ["0", "1", "2"]
+
+    run(main())
+
+
+def test_list_display_dialog_delete_on_close(client):
+    dialog = list_display_dialog(range(3), show_item, delete_on_close=True)
+    dialog.open()
+    dialog.close()
+    assert dialog.is_deleted
+    with pytest.raises(ValueError):
+        list_display_dialog(range(3), pooled=True, delete_on_close=True)
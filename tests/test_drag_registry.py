@@ -0,0 +1,97 @@
+import gc
+import random
+
+from conftest import close_client, new_client
+
+from nicegui_ext import Draggable, Row
+from nicegui_ext.draggable import DRAG_STATE, DragRegistry
+
+N_CLIENTS = 20
+N_CARDS = 10
+
+
+def build_board(client) -> tuple[Row, list[Draggable]]:
+    with client:
+        with Row() as row:
+            cards = [Draggable() for _ in range(N_CARDS)]
+    return row, cards
+
+
+def order(row: Row, cards: list[Draggable]) -> list[int]:
+    return [cards.index(i) for i in row.default_slot.children]
+
+
+def test_concurrent_drags_stay_in_their_client():
+    clients = [new_client() for _ in range(N_CLIENTS)]
+    boards = [build_board(i) for i in clients]
+    expected = [list(range(N_CARDS)) for _ in clients]
+    rng = random.Random(0)
+
+    for _ in range(10):
+        moves = [(rng.randrange(N_CARDS), rng.randrange(N_CARDS)) for _ in clients]
+        # every client starts dragging before any of them drops
+        for (_, cards), (source, _) in zip(boards, moves):
+            cards[source].on_dragstart()
+        assert len(DRAG_STATE) >= N_CLIENTS
+        for n in rng.sample(range(N_CLIENTS), N_CLIENTS):
+            (row, cards), (source, target) = boards[n], moves[n]
+            cards[target].on_drop()
+            if source != target:
+                target_index = expected[n].index(target)
+                expected[n].remove(source)
+                expected[n].insert(target_index, source)
+            assert DRAG_STATE.get(clients[n]) is None
+
+    for (row, cards), exp in zip(boards, expected):
+        assert order(row, cards) == exp
+    for i in clients:
+        close_client(i)
+
+
+def test_drop_without_dragstart_in_same_client_is_ignored():
+    first, second = new_client(), new_client()
+    row_1, cards_1 = build_board(first)
+    row_2, cards_2 = build_board(second)
+
+    cards_1[0].on_dragstart()
+    cards_2[5].on_drop()  # the other client has nothing dragged
+    assert order(row_2, cards_2) == list(range(N_CARDS))
+    assert DRAG_STATE.get(first) is cards_1[0]
+
+    cards_1[5].on_drop()
+    assert order(row_1, cards_1)[:6] == [1, 2, 3, 4, 5, 0]
+    close_client(first)
+    close_client(second)
+
+
+def test_entries_of_deleted_cards_are_released(client):
+    registry = DragRegistry()
+    with Row() as row:
+        card = Draggable()
+    registry.set(client, card)
+    row.remove(card)
+    del card
+    gc.collect()
+    assert registry.get(client) is None
+    assert registry.pop(client) is None
+
+
+def test_entries_of_gone_clients_are_released():
+    clients = [new_client() for _ in range(N_CLIENTS)]
+    for client in clients:
+        row, cards = build_board(client)
+        cards[0].on_dragstart()
+    del row, cards
+    n_entries = len(DRAG_STATE)
+
+    for client in clients[: N_CLIENTS // 2]:
+        close_client(client)
+    del clients[: N_CLIENTS // 2], client
+    gc.collect()
+    assert len(DRAG_STATE) == n_entries - N_CLIENTS // 2
+
+    for client in clients:
+        close_client(client)
+    del clients, client
+    gc.collect()
+    assert len(DRAG_STATE) == n_entries - N_CLIENTS
@@ -0,0 +1,91 @@
+import random
+
+from nicegui import ui
+
+from nicegui_ext import Draggable, Row
+
+
+def test_draggable_position_after_other_children_are_appended(client):
+    row = Row()
+    with row:
+        cards = [Draggable() for _ in range(3)]
+    assert row.draggable_position(cards[2]) == 2  # builds the index
+
+    with row:
+        card = Draggable()
+        ui.label("x")
+        last = Draggable()
+
+    assert row.draggable_position(card) == 3
+    assert row.draggable_position(last) == 5
+    assert row.get_draggable_children() == [*cards, card, last]
+
+
+def test_drop_onto_card_appended_after_index_was_built(client):
+    row = Row()
+    with row:
+        cards = [Draggable() for _ in range(3)]
+    row.get_draggable_children()
+
+    with row:
+        card = Draggable()
+        ui.label("x")
+
+    assert card.accept_drop(cards[0])
+    children = row.default_slot.children
+    assert children.index(cards[0]) == 3
+    assert children.index(card) == 2
+
+
+def scanned_positions(row: Row) -> dict[int, int]:
+    return {
+        i.id: n
+        for n, i in enumerate(row.default_slot.children)
+        if isinstance(i, Draggable) and i.drag_enabled
+    }
+
+
+def test_drop_updates_index_without_rebuilding_it(client):
+    with Row() as row:
+        cards = [Draggable() for _ in range(10)]
+    index = row._draggable_index()
+
+    cards[0].accept_drop(cards[7])
+    cards[9].accept_drop(cards[1])
+    assert row._draggable_index() is index
+    assert index == scanned_positions(row)
+
+
+def test_index_stays_consistent_with_random_changes(client):
+    rnd = random.Random(0)
+    with Row() as row:
+        cards = [Draggable() for _ in range(20)]
+        ui.label("x")
+    row.get_draggable_children()
+
+    for _ in range(300):
+        card = rnd.choice(cards)
+        action = rnd.randrange(6)
+        if action == 0:
+            card.move(target_index=rnd.randrange(len(row.default_slot.children)))
+        elif action == 1:
+            target = rnd.choice(cards)
+            if target is not card and target.drag_enabled and card.drag_enabled:
+                target.accept_drop(card)
+        elif action == 2:
+            card.disable_drag()
+        elif action == 3:
+            card.enable_drag()
+        elif action == 4:
+            ui.label("x").move(row, target_index=rnd.randrange(len(row.default_slot.children)))
+        else:
+            row.shuffle()
+        assert row._draggable_index() == scanned_positions(row)
+        assert [i.id for i in row.get_draggable_children()] == sorted(
+            scanned_positions(row), key=scanned_positions(row).get
+        )
+
+    label = next(i for i in row if isinstance(i, ui.label))
+    row.remove(label)
+    row.remove(cards[0])
+    assert row._draggable_index() == scanned_positions(row)
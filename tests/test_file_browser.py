@@ -0,0 +1,83 @@
+import asyncio
+import os
+
+import pytest
+from nicegui import ui
+from nicegui.events import GenericEventArguments, handle_event
+
+from nicegui_ext.file_browser import ServerFileDialog, ServerFilePickerElement
+
+
+@pytest.fixture
+def tree(tmp_path):
+    root = tmp_path / "root"
+    (root / "sub").mkdir(parents=True)
+    (root / "sub" / "a.txt").write_text("a")
+    (tmp_path / "secret.txt").write_text("s")
+    os.symlink(tmp_path, root / "escape")
+    return root
+
+
+def test_paths_outside_root_are_refused(tree):
+    dialog = ServerFileDialog(initial_directory=str(tree / "sub"), root=str(tree))
+    assert dialog.is_allowed(str(tree / "sub" / "a.txt"))
+    assert dialog.is_allowed(str(tree / "sub" / ".."))
+    assert not dialog.is_allowed(str(tree / ".."))
+    assert not dialog.is_allowed(str(tree / "escape" / "secret.txt"))
+    with pytest.raises(ValueError):
+        ServerFileDialog(initial_directory=str(tree.parent), root=str(tree))
+
+
+def test_root_defaults_to_initial_directory(tree):
+    dialog = ServerFileDialog(initial_directory=str(tree))
+    assert dialog.root == os.path.realpath(tree)
+    assert not dialog.is_allowed("/")
+
+
+async def click_entry(client, dialog: ui.dialog, name: str) -> None:
+    label = next(i for i in dialog.descendants() if isinstance(i, ui.label) and i.text == name)
+    row = label.parent_slot.parent
+    for listener in row._event_listeners.values():
+        handle_event(listener.handler, GenericEventArguments(sender=row, client=client, args={}))
+    await asyncio.sleep(0.1)
+
+
+def test_browser_stays_inside_root(client, run, tree):
+    file_dialog = ServerFileDialog(initial_directory=str(tree), root=str(tree))
+
+    async def open_in_client():
+        with client:
+            return await file_dialog.open_async()
+
+    async def main():
+        task = asyncio.create_task(open_in_client())
+        await asyncio.sleep(0.1)
+        dialog = next(i for i in client.elements.values() if isinstance(i, ui.dialog))
+        buttons = [i for i in dialog.descendants() if isinstance(i, ui.button)]
+        up_button = next(i for i in buttons if i._props.get("icon") == "arrow_upward")
+        path_label = next(
+            i for i in dialog.descendants() if "font-mono break-all" in " ".join(i._classes)
+        )
+        assert not up_button.enabled
+        assert path_label.text == os.path.realpath(tree)
+
+        await click_entry(client, dialog, "escape")
+        assert path_label.text == os.path.realpath(tree)  # the symlink leads outside of the root
+
+        await click_entry(client, dialog, "sub")
+        assert path_label.text == os.path.realpath(tree / "sub")
+        assert up_button.enabled
+        dialog.close()
+        return await task
+
+    assert run(main()) is None
+
+
+def test_picker_value_outside_root(client, tree):
+    picker = ServerFilePickerElement(initial_directory=str(tree), root=str(tree))
+    picker.path_input.value = str(tree / "sub" / "a.txt")
+    assert picker.value == str(tree / "sub" / "a.txt")
+    assert picker.path_exists(picker.path_input.value)
+    picker.path_input.value = str(tree.parent / "secret.txt")
+    assert picker.value is None
+    assert not picker.path_exists(picker.path_input.value)
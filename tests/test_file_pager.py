@@ -0,0 +1,69 @@
+import pytest
+
+from nicegui_ext.file_pager import FilePager, read_text
+
+TEXT = "".join(f"line {i}: čšž €\n" for i in range(200))  # 2 and 3 byte characters
+
+
+@pytest.fixture
+def text_file(tmp_path):
+    path = tmp_path / "text.txt"
+    path.write_text(TEXT, encoding="utf-8")
+    return str(path)
+
+
+def test_read_text_whole_file_in_small_chunks(text_file):
+    # chunks of 5 bytes split the multibyte characters
+    assert read_text(text_file, chunk_size=5) == (TEXT, False)
+
+
+@pytest.mark.parametrize("max_bytes", [1, 9, 10, 11, 12, 100])
+def test_read_text_truncates_at_a_character_boundary(text_file, max_bytes):
+    text, truncated = read_text(text_file, max_bytes=max_bytes, chunk_size=4)
+    assert truncated
+    assert "�" not in text
+    assert TEXT.startswith(text)
+    assert max_bytes - 2 <= len(text.encode()) <= max_bytes
+
+
+def test_read_text_limit_at_file_size_is_not_truncated(text_file):
+    size = len(TEXT.encode())
+    assert read_text(text_file, max_bytes=size) == (TEXT, False)
+    assert read_text(text_file, max_bytes=size - 1)[1]
+
+
+def test_pages_cover_the_file_and_end_at_line_breaks(text_file):
+    with FilePager(text_file, page_size=100) as pager:
+        pages = []
+        index = 0
+        while pager.has_page(index):
+            pages.append(pager.read_page(index))
+            index += 1
+        bounds = [pager.page_bounds(i) for i in range(len(pages))]
+
+    assert "".join(pages) == TEXT
+    assert all(i.endswith("\n") for i in pages)
+    assert bounds[0][0] == 0 and bounds[-1][1] == len(TEXT.encode())
+    assert all(a[1] == b[0] for a, b in zip(bounds, bounds[1:]))
+    assert all(end - start >= 100 for start, end in bounds[:-1])
+
+
+def test_page_bounds_out_of_range(text_file):
+    with FilePager(text_file, page_size=1024) as pager:
+        last = len(TEXT.encode()) // 1024
+        assert pager.has_page(last)
+        assert not pager.has_page(last + 1)
+        with pytest.raises(IndexError):
+            pager.page_bounds(last + 1)
+        with pytest.raises(IndexError):
+            pager.page_bounds(-1)
+
+
+def test_empty_file(tmp_path):
+    path = tmp_path / "empty.txt"
+    path.write_bytes(b"")
+    with FilePager(str(path)) as pager:
+        assert len(pager) == 1
+        assert pager.has_page(0)
+        assert not pager.has_page(1)
+        assert pager.read_page(0) == ""
@@ -0,0 +1,94 @@
+import enum
+import typing as T
+
+import pytest
+
+from nicegui_ext.helpers import is_type
+
+
+class Color(enum.Enum):
+    RED = "red"
+    BLUE = "blue"
+
+
+@pytest.mark.parametrize(
+    "value, t, expected",
+    [
+        ([1, 2], list[int], True),
+        ([], list[int], True),
+        ([1, "2"], list[int], False),
+        ([1, True], list[int], True),  # bool is a subclass of int
+        ([1, 2.0], list[int | float], True),
+        ([1, None], list[int | None], True),
+        ([1, "2"], list[int | float], False),
+        ((1, 2), list[int], False),
+        ({1, 2}, set[int], True),
+        (frozenset({"a"}), frozenset[str], True),
+        ([[1], [2, 3]], list[list[int]], True),
+        ([[1], ["2"]], list[list[int]], False),
+        (["a", "b"], list[T.Literal["a", "b"]], True),
+        (["a", "c"], list[T.Literal["a", "b"]], False),
+        ([1, "a"], list, True),
+        ([1, "a"], list[T.Any], True),
+    ],
+)
+def test_lists_and_sets(value, t, expected):
+    assert is_type(value, t) is expected
+
+
+@pytest.mark.parametrize(
+    "value, t, expected",
+    [
+        ((1, "a"), tuple[int, str], True),
+        (("a", 1), tuple[int, str], False),
+        ((1,), tuple[int, str], False),
+        ((1, "a", 2), tuple[int, str], False),
+        ([1, "a"], tuple[int, str], False),
+        ((), tuple[int, ...], True),
+        ((1, 2, 3), tuple[int, ...], True),
+        ((1, "2"), tuple[int, ...], False),
+        ((1,), tuple[int], True),
+    ],
+)
+def test_tuples(value, t, expected):
+    assert is_type(value, t) is expected
+
+
+@pytest.mark.parametrize(
+    "value, t, expected",
+    [
+        ({"a": 1}, dict[str, int], True),
+        ({}, dict[str, int], True),
+        ({"a": "1"}, dict[str, int], False),
+        ({1: 1}, dict[str, int], False),
+        ({"a": [1]}, dict[str, list[int]], True),
+        ({"a": ["1"]}, dict[str, list[int]], False),
+        ([("a", 1)], dict[str, int], False),
+    ],
+)
+def test_dicts(value, t, expected):
+    assert is_type(value, t) is expected
+
+
+def test_annotated_enum_and_unions():
+    assert is_type(3, T.Annotated[int, "positive"])
+    assert not is_type("3", T.Annotated[int, "positive"])
+    assert is_type([1], list[T.Annotated[int, "positive"]])
+    assert is_type(Color.RED, Color)
+    assert not is_type("red", Color)
+    assert is_type([Color.RED, Color.BLUE], list[Color])
+    assert is_type(None, T.Optional[int])
+    assert is_type("a", int | str)
+    assert not is_type(1.5, int | str)
+
+
+def test_unhashable_type_hints():
+    annotated = T.Annotated[list[int], {"max_length": 3}]
+    assert is_type([1, 2], annotated)
+    assert not is_type(["1"], annotated)
+
+    literal = T.Literal[[1], [2]]
+    assert is_type([1], literal)
+    assert not is_type([3], literal)
+    assert is_type([[1], [2]], list[literal])  # type: ignore
+    assert not is_type([[3]], list[literal])  # type: ignore
@@ -0,0 +1,39 @@
+import os
+import re
+import subprocess
+import sys
+
+# Cumulative import time of nicegui_ext.ui, not counting nicegui itself
+IMPORT_BUDGET_US = 500_000
+
+SCRIPT = """
+import sys
+import nicegui
+import nicegui_ext.ui
+assert "tkinter" not in sys.modules, "tkinter was imported"
+"""
+
+
+def import_times(stderr: str) -> dict[str, int]:
+    """Parse the output of `python -X importtime` into cumulative times (µs) by module."""
+    times = {}
+    for line in stderr.splitlines():
+        match = re.match(r"import time:\s+\d+ \|\s+(\d+) \|\s*(\S+)", line)
+        if match:
+            times[match.group(2)] = int(match.group(1))
+    return times
+
+
+def test_cold_import_without_display():
+    env = {k: v for k, v in os.environ.items() if k != "DISPLAY"}
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", SCRIPT],
+        env=env,
+        capture_output=True,
+        text=True,
+        timeout=120,
+    )
+    assert result.returncode == 0, result.stderr[-2000:]
+    times = import_times(result.stderr)
+    assert "tkinter" not in times
+    assert times["nicegui_ext.ui"] < IMPORT_BUDGET_US
@@ -0,0 +1,42 @@
+from dataclasses import dataclass
+
+from nicegui import ui
+
+from nicegui_ext.auto.list_element import ClassListElement
+
+
+@dataclass
+class Item:
+    name: str
+    count: int = 0
+
+
+def test_rows_are_virtualized(client):
+    editor = ClassListElement(Item, [Item(f"item {i}", i) for i in range(500)], page_size=20)
+    n_elements = len(client.elements)
+    for page in range(editor.rows_view.n_pages):
+        editor.rows_view.show_page(page)
+        assert len(client.elements) <= n_elements + 20 * 8
+    assert [i.count for i in editor.get_instances()] == list(range(500))
+
+
+def test_edited_values_survive_page_eviction(client):
+    editor = ClassListElement(Item, [Item(f"item {i}", i) for i in range(100)], page_size=10)
+    cell = next(i for i in editor.rows_view.pages[0].descendants() if "w-40" in i._classes)
+    editor._open_editor(cell, editor.rows[0], editor.columns["name"])
+    next(i for i in cell.descendants() if isinstance(i, ui.input)).value = "edited"
+
+    editor.rows_view.show_page(5)
+    editor.rows_view.show_page(0)
+    labels = [i.text for i in editor.rows_view.pages[0].descendants() if isinstance(i, ui.label)]
+    assert labels[0] == "edited"
+    assert editor.get_instances()[0] == Item("edited", 0)
+
+
+def test_add_and_remove_rows(client):
+    editor = ClassListElement(Item, [Item(f"item {i}", i) for i in range(30)], page_size=10)
+    editor.remove_row(editor.rows[0])
+    editor.add_row(Item("last", 99))
+    labels = [i.text for i in editor.rows_view.descendants() if isinstance(i, ui.label)]
+    assert labels[:2] == ["item 1", "1"]
+    assert editor.get_instances()[-1] == Item("last", 99)
@@ -0,0 +1,60 @@
+import pytest
+from nicegui.element import Element
+
+from nicegui_ext import Draggable
+from nicegui_ext.metrics import MetricsRegistry, _iter_subclasses
+
+
+class Card(Draggable):
+    def __init__(self) -> None:
+        super().__init__()
+
+
+@pytest.fixture
+def metrics():
+    registry = MetricsRegistry()
+    registry.register(Draggable)
+    yield registry
+    registry.disable()
+
+
+def own_methods() -> dict:
+    methods = {(Element, "update"): Element.__dict__["update"]}
+    for cls in _iter_subclasses(Draggable):
+        if "__init__" in cls.__dict__:
+            methods[(cls, "__init__")] = cls.__dict__["__init__"]
+    return methods
+
+
+def test_enable_and_disable_restore_the_original_methods(metrics):
+    originals = own_methods()
+    metrics.enable()
+    patched = own_methods()
+    assert all(patched[k] is not v for k, v in originals.items())
+
+    metrics.disable()
+    assert own_methods() == originals
+    metrics.enable()
+    metrics.disable()
+    assert own_methods() == originals
+
+
+def test_counts_constructions_and_update_calls(client, metrics):
+    metrics.enable()
+    card = Card()
+    stats = metrics.get("Card")
+    assert stats.constructions == 1  # the wrapped Draggable.__init__ is not counted separately
+    assert stats.elements_created == 1
+    assert stats.initial_bytes > 0
+
+    card.update()
+    card.update()
+    assert stats.update_calls == 2
+    assert stats.update_call_bytes > 0
+    assert "Draggable" not in metrics.stats
+
+    metrics.disable()
+    Card().update()
+    card.update()
+    assert stats.constructions == 1
+    assert stats.update_calls == 2
@@ -0,0 +1,203 @@
+import asyncio
+import sys
+import threading
+import types
+
+import pytest
+
+from nicegui_ext import native_file_picker
+from nicegui_ext.native_file_picker import (
+    NativeFileDialog,
+    NativeFilePickerElement,
+    PathExistsCache,
+    TkThread,
+)
+
+
+class FakeTk:
+    """Stands in for the Tk root window, so the Tk thread runs without a display."""
+
+    def withdraw(self) -> None:
+        ...
+
+    def lift(self) -> None:
+        ...
+
+    def attributes(self, *args) -> None:
+        ...
+
+    def update(self) -> None:
+        ...
+
+
+@pytest.fixture
+def fake_tkinter(monkeypatch) -> types.ModuleType:
+    tkinter = types.ModuleType("tkinter")
+    tkinter.Tk = FakeTk  # type: ignore
+    tkinter.filedialog = types.SimpleNamespace(  # type: ignore
+        askopenfilename=lambda **options: f"{options['initialdir']}/chosen.txt",
+        askdirectory=lambda **options: options["initialdir"],
+        asksaveasfilename=lambda **options: f"{options['initialdir']}/saved.txt",
+    )
+    monkeypatch.setitem(sys.modules, "tkinter", tkinter)
+    return tkinter
+
+
+@pytest.fixture
+def tk_thread(fake_tkinter, monkeypatch) -> TkThread:
+    thread = TkThread()
+    monkeypatch.setattr(native_file_picker, "_TK_THREAD", thread)
+    return thread
+
+
+def test_jobs_run_in_order_on_one_thread(tk_thread):
+    release = threading.Event()
+    calls = []
+
+    def job(n):
+        def run(root):
+            if n == 0:
+                release.wait(5)
+            calls.append((n, threading.current_thread().name, isinstance(root, FakeTk)))
+            return n
+
+        return run
+
+    futures = [tk_thread.submit(job(n)) for n in range(5)]
+    assert not any(i.done() for i in futures)  # the first job holds the thread
+    release.set()
+    assert [i.result(5) for i in futures] == list(range(5))
+    assert calls == [(n, "tkinter", True) for n in range(5)]
+
+
+def test_job_errors_are_set_on_their_futures(tk_thread):
+    def fail(root):
+        raise RuntimeError("job failed")
+
+    with pytest.raises(RuntimeError, match="job failed"):
+        tk_thread.submit(fail).result(5)
+    assert tk_thread.submit(lambda root: "next").result(5) == "next"
+
+
+def test_tk_errors_are_set_on_every_future(fake_tkinter):
+    def no_display():
+        raise RuntimeError("no display name")
+
+    fake_tkinter.Tk = no_display  # type: ignore
+    thread = TkThread()
+    for _ in range(2):
+        with pytest.raises(RuntimeError, match="no display name"):
+            thread.submit(lambda root: None).result(5)
+
+
+def test_open_async_with_mocked_filedialog(tk_thread, tmp_path):
+    dialog = NativeFileDialog(initial_directory=str(tmp_path))
+    path = asyncio.run(dialog.open_async(timeout=5))
+    assert path == f"{tmp_path}/chosen.txt"
+    assert dialog.chosen == path
+    assert dialog.last_dir == str(tmp_path)
+
+
+def test_open_async_timeout_and_cancellation_drop_queued_dialogs(tk_thread, monkeypatch):
+    release = threading.Event()
+    shown = []
+
+    def show(self, root):
+        shown.append(self)
+        release.wait(5)
+        return "path"
+
+    monkeypatch.setattr(NativeFileDialog, "_show", show)
+    first, second, third = NativeFileDialog(), NativeFileDialog(), NativeFileDialog()
+
+    async def main():
+        first_task = asyncio.create_task(first.open_async())
+        await asyncio.sleep(0.05)
+        with pytest.raises(asyncio.TimeoutError):
+            await second.open_async(timeout=0.05)  # queued behind the first dialog
+
+        third_task = asyncio.create_task(third.open_async())
+        await asyncio.sleep(0.05)
+        third_task.cancel()
+        await asyncio.sleep(0.05)  # the cancellation reaches the queued job through the loop
+        release.set()
+        assert await first_task == "path"
+
+    asyncio.run(main())
+    tk_thread.submit(lambda root: None).result(5)  # wait for the queue to drain
+    assert shown == [first]
+
+
+def test_path_exists_cache_ttl(tmp_path, monkeypatch):
+    now = [100.0]
+    monkeypatch.setattr(native_file_picker.time, "monotonic", lambda: now[0])
+    cache = PathExistsCache(ttl=2.0)
+    path = tmp_path / "file.txt"
+    path.write_text("")
+
+    assert cache.exists(str(path))
+    path.unlink()
+    now[0] += 1.9
+    assert cache.exists(str(path))  # cached
+    now[0] += 0.2
+    assert not cache.exists(str(path))
+
+
+def test_path_exists_cache_maxsize(tmp_path):
+    cache = PathExistsCache(maxsize=2)
+    for name in "abc":
+        cache.exists(str(tmp_path / name))
+    assert list(cache._entries) == [str(tmp_path / "b"), str(tmp_path / "c")]
+
+
+async def wait_for(condition, timeout: float = 5) -> None:
+    for _ in range(int(timeout / 0.01)):
+        if condition():
+            return
+        await asyncio.sleep(0.01)
+    raise TimeoutError
+
+
+def test_on_change_drops_out_of_order_results(client, run):
+    gates = {"slow": threading.Event(), "fast": threading.Event()}
+    checked = []
+    changes = []
+
+    def path_exists(path):
+        gates[path].wait(5)
+        checked.append(path)
+        return path == "fast"
+
+    picker = NativeFilePickerElement(debounce=0, on_change_events=[lambda: changes.append(1)])
+    picker.path_exists = path_exists  # type: ignore
+
+    async def main():
+        picker.path_input.value = "slow"
+        await asyncio.sleep(0.05)
+        picker.path_input.value = "fast"
+        gates["fast"].set()
+        await wait_for(lambda: picker.label_file_exists.text == "🟢")
+        gates["slow"].set()
+        await wait_for(lambda: len(checked) == 2)
+        await asyncio.sleep(0.05)
+
+    run(main())
+    assert checked == ["fast", "slow"]
+    assert picker.label_file_exists.text == "🟢"
+    assert changes == [1]
+
+
+def test_on_change_debounces(client, run):
+    checked = []
+    picker = NativeFilePickerElement(debounce=0.05)
+    picker.path_exists = lambda path: checked.append(path) or True  # type: ignore
+
+    async def main():
+        for value in ["a", "ab", "abc"]:
+            picker.path_input.value = value
+            await asyncio.sleep(0.01)
+        await wait_for(lambda: checked)
+        await asyncio.sleep(0.1)
+
+    run(main())
+    assert checked == ["abc"]
@@ -0,0 +1,52 @@
+from dataclasses import dataclass
+
+import pytest
+
+from nicegui_ext.auto.class_element import ClassElement
+from nicegui_ext.auto.parser import compile_coercer
+
+
+def test_coerce_iterable_items():
+    assert compile_coercer(list[str])(("a", "b")) == ["a", "b"]
+    assert compile_coercer(list[int])(("1", 2)) == [1, 2]
+    assert compile_coercer(set[int])(["1"]) == {1}
+    assert compile_coercer(tuple[int, ...])("1, 2") == (1, 2)
+
+
+def test_coerce_blank_text_to_empty_container():
+    assert compile_coercer(list[str])("") == []
+    assert compile_coercer(list[int])("  ") == []
+    assert compile_coercer(set[int])("") == set()
+    assert compile_coercer(tuple[int, ...])("") == ()
+
+
+def test_coerce_fixed_length_tuple():
+    coerce = compile_coercer(tuple[int, str])
+    assert coerce("1,a") == (1, "a")
+    assert coerce(["2", "b"]) == (2, "b")
+    assert coerce((3, "c")) == (3, "c")
+    with pytest.raises(ValueError):
+        coerce("1,a,b")
+
+
+@dataclass
+class Tagged:
+    name: str = "x"
+    tags: list[str] = ("a",)  # type: ignore
+
+
+def test_lazy_form_with_tuple_default(client):
+    form = ClassElement(Tagged, expandable=True, lazy=True)
+    assert not form.is_built
+    assert form.get_args() == {"name": "x", "tags": ["a"]}
+    assert ClassElement(Tagged).get_args() == form.get_args()
+
+
+class EmptyLists:
+    def __init__(self, tags: list[str] = [], nums: list[int] = []) -> None:
+        self.tags = tags
+        self.nums = nums
+
+
+def test_form_with_empty_list_defaults(client):
+    assert ClassElement(EmptyLists).get_args() == {"tags": [], "nums": []}
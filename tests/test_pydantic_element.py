@@ -0,0 +1,59 @@
+import itertools
+from dataclasses import dataclass, field
+from uuid import uuid4
+
+from pydantic import BaseModel, Field
+
+from nicegui_ext.auto.class_element import ClassElement
+from nicegui_ext.auto.list_element import ClassListElement
+from nicegui_ext.auto.pydantic_element import PydanticModelElement
+
+COUNTER = itertools.count()
+
+
+class Item(BaseModel):
+    id: str = Field(default_factory=lambda: uuid4().hex)
+    n: int = Field(default_factory=lambda: next(COUNTER))
+    tags: list[str] = Field(default_factory=list)
+
+
+def test_default_factories_are_called_for_each_form(client):
+    first = PydanticModelElement(Item).get_instance()
+    second = PydanticModelElement(Item).get_instance()
+    assert first.id != second.id
+    assert second.n == first.n + 1
+    assert first.tags == second.tags == []
+
+
+def test_lazy_forms_and_reset_call_default_factories(client):
+    form = PydanticModelElement(Item, expandable=True, lazy=True)
+    other = PydanticModelElement(Item, expandable=True, lazy=True)
+    assert form.pending_values["tags"] is not other.pending_values["tags"]
+    n = form.get_args()["n"]
+
+    form.reset_to_defaults()
+    assert form.get_args()["n"] > n
+    form.ensure_built()
+    form.reset_to_defaults()
+    assert form.get_args()["n"] > n + 1
+
+
+@dataclass
+class Tags:
+    tags: list[str] = field(default_factory=list)
+    n: int = field(default_factory=lambda: next(COUNTER))
+
+
+def test_dataclass_default_factories(client):
+    first = ClassElement(Tags).get_args()
+    second = ClassElement(Tags).get_args()
+    assert first["tags"] == second["tags"] == []
+    assert second["n"] == first["n"] + 1
+
+
+def test_list_rows_call_default_factories(client):
+    editor = ClassListElement(Tags)
+    editor.add_row()
+    editor.add_row()
+    first, second = editor.get_instances()
+    assert second.n == first.n + 1
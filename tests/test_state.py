@@ -0,0 +1,35 @@
+from typing import Optional
+
+from pydantic import BaseModel
+
+from nicegui_ext.auto.pydantic_element import PydanticModelElement
+
+
+class Inner(BaseModel):
+    x: int = 1
+
+
+class Outer(BaseModel):
+    name: str = "a"
+    maybe: Optional[Inner] = None
+
+
+def test_restore_opened_optional_model(client):
+    form = PydanticModelElement(Outer)
+    nested = form.field_elements["maybe"]
+    nested.ensure_built()
+    nested.field_elements["x"].value = 42
+    assert form.get_instance().maybe == Inner(x=42)
+
+    restored = PydanticModelElement(Outer)
+    restored.load_state(form.dump_state())
+    assert restored.get_instance().maybe == Inner(x=42)
+
+
+def test_restore_unopened_optional_model(client):
+    form = PydanticModelElement(Outer)
+    assert form.get_state()["values"]["maybe"] is None
+
+    restored = PydanticModelElement(Outer)
+    restored.load_state(form.dump_state())
+    assert restored.get_instance().maybe is None
@@ -0,0 +1,100 @@
+import asyncio
+import datetime
+from dataclasses import dataclass
+
+from nicegui import ui
+from nicegui.events import GenericEventArguments
+
+from nicegui_ext.auto.class_element import ClassElement
+from nicegui_ext.ui import DatePicker, VirtualColumn, virtual_list_display_dialog
+
+
+def scroll(
+    column: VirtualColumn, client, position: float, percentage: float
+) -> GenericEventArguments:
+    size = len(column.items) * column.item_height
+    return GenericEventArguments(
+        sender=column,
+        client=client,
+        args={"verticalPosition": position, "verticalPercentage": percentage, "verticalSize": size},
+    )
+
+
+def test_virtual_column_keeps_pages_near_viewport(client, run):
+    column = VirtualColumn(lambda i: ui.label(str(i)), items=list(range(10_000)), page_size=50)
+    n_elements = len(client.elements)
+    page_height = column.page_size * column.item_height
+
+    for page in range(0, column.n_pages, 7):
+        run(column._on_scroll(scroll(column, client, page * page_height, page / column.n_pages)))
+        assert sorted(column.pages) == [i for i in (page - 1, page, page + 1) if i >= 0]
+        assert len(client.elements) <= n_elements + 2 * (1 + 2 * column.page_size)
+
+    labels = [
+        i.text for i in column.pages[column.current_page].descendants() if isinstance(i, ui.label)
+    ]
+    assert labels == [
+        str(i) for i in range(column.current_page * 50, column.current_page * 50 + 50)
+    ]
+
+
+def test_virtual_column_refresh_after_removal(client):
+    items = list(range(120))
+    column = VirtualColumn(lambda i: ui.label(str(i)), items=items, page_size=50)
+    del items[10]
+    column.refresh(10)
+    labels = [i.text for i in column.descendants() if isinstance(i, ui.label)]
+    assert labels == [str(i) for i in items[:100]]
+
+
+def test_virtual_list_display_dialog_streams_items(client, run):
+    async def items():
+        for i in range(1000):
+            yield i
+
+    async def main():
+        dialog = virtual_list_display_dialog(items(), page_size=50)
+        column = next(i for i in dialog.descendants() if isinstance(i, VirtualColumn))
+        dialog.open()
+        await asyncio.sleep(0.01)
+        assert len(column.items) == 50
+        for page in range(1, 20):
+            column.show_page(page)
+            await column.load_next()
+        await column.load_next()  # an empty page ends loading
+        assert column.exhausted
+        assert len(column.items) == 1000
+        assert sorted(column.pages) == [17, 18, 19]
+
+    run(main())
+
+
+def test_date_picker_builds_the_calendar_upfront_by_default(client):
+    picker = DatePicker(value=datetime.date(2024, 5, 1))
+    assert picker.menu_element is not None
+    assert picker.date_element.value == "2024-05-01"  # type: ignore
+
+    picker.value = "2024-06-02"
+    assert picker.date_element.value == "2024-06-02"  # type: ignore
+    picker.date_element.value = "2024-07-03"  # type: ignore
+    assert picker.value == "2024-07-03"
+
+
+def test_lazy_date_picker_builds_the_calendar_on_open(client):
+    picker = DatePicker(value="2024-05-01", lazy=True)
+    assert picker.menu_element is None and picker.date_element is None
+    picker.value = "2024-06-02"
+    picker.open_menu()
+    assert picker.date_element.value == "2024-06-02"  # type: ignore
+
+
+@dataclass
+class Event:
+    day: datetime.date = datetime.date(2024, 5, 1)
+
+
+def test_forms_use_lazy_date_pickers(client):
+    picker = ClassElement(Event).field_elements["day"]
+    assert isinstance(picker, DatePicker)
+    assert picker.date_element is None
+    assert picker.value == "2024-05-01"